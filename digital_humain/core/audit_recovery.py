@@ -5,6 +5,7 @@ import hashlib
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from datetime import datetime
+import numpy as np
 from pydantic import BaseModel, Field
 from loguru import logger
 
@@ -125,6 +126,13 @@ class AuditRecoveryEngine:
         self.reasoning_logs: List[ReasoningLog] = []
         self.checkpoints: List[StateCheckpoint] = []
         
+        # Column ring buffers mirroring the retained reasoning logs
+        self._capacity = max(1, max_logs)
+        self._steps = np.zeros(self._capacity, dtype=np.int32)
+        self._conf = np.zeros(self._capacity, dtype=np.float32)
+        self._failed = np.zeros(self._capacity, dtype=bool)
+        self._n = 0
+        
         # Create subdirectories
         self.logs_dir = self.storage_path / "logs"
         self.checkpoints_dir = self.storage_path / "checkpoints"
@@ -173,6 +181,11 @@ class AuditRecoveryEngine:
         )
         
         self.reasoning_logs.append(log_entry)
+        slot = self._n % self._capacity
+        self._steps[slot] = step
+        self._conf[slot] = confidence
+        self._failed[slot] = bool(error)
+        self._n += 1
         
         # Enforce max logs limit
         if len(self.reasoning_logs) > self.max_logs:
@@ -208,7 +221,8 @@ class AuditRecoveryEngine:
             return None
         
         # Get IDs of all reasoning logs up to this point
-        log_ids = [log.id for log in self.reasoning_logs if log.step <= step]
+        keep = self._retained(self._steps) <= step
+        log_ids = [log.id for log, k in zip(self.reasoning_logs, keep) if k]
         
         checkpoint = StateCheckpoint.create(
             task=task,
@@ -334,12 +348,9 @@ class AuditRecoveryEngine:
     
     def get_stats(self) -> Dict[str, Any]:
         """Get statistics about the audit engine."""
-        avg_confidence = (
-            sum(log.confidence for log in self.reasoning_logs) / len(self.reasoning_logs)
-            if self.reasoning_logs else 0.0
-        )
-        
-        error_count = sum(1 for log in self.reasoning_logs if log.error)
+        n = min(self._n, self._capacity)
+        avg_confidence = float(self._conf[:n].mean()) if n else 0.0
+        error_count = int(self._failed[:n].sum())
         
         return {
             "total_logs": len(self.reasoning_logs),
@@ -367,6 +378,7 @@ class AuditRecoveryEngine:
         
         self.reasoning_logs.clear()
         self.checkpoints.clear()
+        self._n = 0
         
         # Clear storage
         for file in self.logs_dir.glob("log_*.json"):
@@ -376,6 +388,13 @@ class AuditRecoveryEngine:
         
         logger.info(f"Cleared {log_count} logs and {checkpoint_count} checkpoints")
     
+    def _retained(self, column: np.ndarray) -> np.ndarray:
+        """Return a ring-buffer column in the same order as reasoning_logs."""
+        if self._n <= self._capacity:
+            return column[:self._n]
+        start = self._n % self._capacity
+        return np.concatenate((column[start:], column[:start]))
+    
     def _persist_log(self, log: ReasoningLog) -> None:
         """Persist a reasoning log to disk."""
         filepath = self.logs_dir / f"log_{log.id}.json"
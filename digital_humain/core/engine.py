@@ -185,14 +185,18 @@ class AgentEngine:
     async def run_async(
         self,
         task: str,
-        context: Optional[Dict[str, Any]] = None
+        context: Optional[Dict[str, Any]] = None,
+        recursion_limit: int = 25
     ) -> AgentState:
         """
         Execute the agent asynchronously using the graph.
         
+        Cancelling the awaiting task stops execution at the next node boundary.
+        
         Args:
             task: Task description
             context: Optional context dictionary
+            recursion_limit: Maximum number of graph iterations
             
         Returns:
             Final agent state
@@ -208,11 +212,14 @@ class AgentEngine:
         
         try:
             # Execute the graph asynchronously
-            final_state = await self.graph.ainvoke(state)
+            final_state = await self.graph.ainvoke(state, config={"recursion_limit": recursion_limit})
             logger.info(f"Async graph execution completed. Steps: {final_state['current_step']}")
             return final_state
         
         except Exception as e:
-            logger.exception(f"Error during async graph execution: {e}")
+            if "recursion limit" in str(e).lower():
+                logger.error(f"Recursion limit ({recursion_limit}) exceeded during async graph execution.")
+            else:
+                logger.exception(f"Error during async graph execution: {e}")
             state['error'] = str(e)
             return state
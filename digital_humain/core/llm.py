@@ -10,6 +10,30 @@ import json
 class LLMProvider(ABC):
     """Abstract base class for LLM providers."""
     
+    timeout: float = 120
+    _client: Optional[httpx.Client] = None
+    
+    def _sync_client(self) -> httpx.Client:
+        """Return a keep-alive client reused by every synchronous call."""
+        if self._client is None:
+            self._client = httpx.Client(
+                timeout=self.timeout,
+                limits=httpx.Limits(max_keepalive_connections=5, keepalive_expiry=30.0),
+            )
+        return self._client
+    
+    def close(self) -> None:
+        """Close the pooled client, if one was opened."""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+    
+    def __enter__(self) -> "LLMProvider":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
     @abstractmethod
     async def generate(
         self,
@@ -131,11 +155,11 @@ class OllamaProvider(LLMProvider):
             payload["options"]["stop"] = stop
         
         try:
-            with httpx.Client(timeout=self.timeout) as client:
-                response = client.post(url, json=payload)
-                response.raise_for_status()
-                result = response.json()
-                return result.get("response", "")
+            client = self._sync_client()
+            response = client.post(url, json=payload)
+            response.raise_for_status()
+            result = response.json()
+            return result.get("response", "")
         
         except httpx.HTTPError as e:
             if hasattr(e, 'response') and e.response is not None and e.response.status_code == 500:
@@ -144,16 +168,20 @@ class OllamaProvider(LLMProvider):
             logger.error(f"Ollama API error: {e}")
             raise RuntimeError(f"Failed to generate completion: {e}")
     
-    def list_models(self) -> List[Dict[str, Any]]:
-        """List available models."""
+    def list_models(self, timeout: Any = 30) -> List[Dict[str, Any]]:
+        """
+        List available models.
+        
+        Args:
+            timeout: Request timeout (seconds or httpx.Timeout); keep it short for reachability probes
+        """
         url = f"{self.base_url}/api/tags"
         
         try:
-            with httpx.Client(timeout=30) as client:
-                response = client.get(url)
-                response.raise_for_status()
-                result = response.json()
-                return result.get("models", [])
+            response = self._sync_client().get(url, timeout=timeout)
+            response.raise_for_status()
+            result = response.json()
+            return result.get("models", [])
         
         except httpx.HTTPError as e:
             logger.error(f"Failed to list models: {e}")
@@ -346,11 +374,11 @@ class OpenRouterProvider(LLMProvider):
         payload = self._payload(prompt, system_prompt, temperature, max_tokens, stop)
 
         try:
-            with httpx.Client(timeout=self.timeout) as client:
-                response = client.post(url, json=payload, headers=self._headers())
-                response.raise_for_status()
-                result = response.json()
-                return result["choices"][0]["message"]["content"]
+            client = self._sync_client()
+            response = client.post(url, json=payload, headers=self._headers())
+            response.raise_for_status()
+            result = response.json()
+            return result["choices"][0]["message"]["content"]
         except httpx.HTTPError as e:
             logger.error(f"OpenRouter API error: {e}")
             raise RuntimeError(f"Failed to generate completion: {e}")
@@ -458,11 +486,11 @@ class LettaProvider(LLMProvider):
         url = self._url(f"/agents/{self.agent_id}/messages")
         payload = self._payload(prompt, system_prompt, temperature, max_tokens, stop)
         try:
-            with httpx.Client(timeout=self.timeout) as client:
-                resp = client.post(url, json=payload, headers=self._headers())
-                resp.raise_for_status()
-                data = resp.json()
-                return data.get("response", "") or data.get("message", "")
+            client = self._sync_client()
+            resp = client.post(url, json=payload, headers=self._headers())
+            resp.raise_for_status()
+            data = resp.json()
+            return data.get("response", "") or data.get("message", "")
         except httpx.HTTPError as e:
             logger.error(f"Letta API error: {e}")
             raise RuntimeError(f"Failed to generate completion: {e}")
@@ -1,8 +1,9 @@
 """Workflow Definition Language (WDL) for generalized workflows."""
 
 import json
+from collections import defaultdict
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Set, Tuple, Union
 from enum import Enum
 from datetime import datetime
 from pydantic import BaseModel, Field
@@ -251,7 +252,7 @@ class WorkflowDefinition(BaseModel):
             "goal": self.narrative_memory.goal,
             "total_steps": len(self.steps),
             "total_actions": sum(len(step.actions) for step in self.steps),
-            "tags": self.tags,
+            "tags": list(self.tags),
             "category": self.category,
             "difficulty": self.difficulty,
             "created_at": self.created_at,
@@ -297,6 +298,11 @@ class WorkflowDefinition(BaseModel):
         return is_valid, errors
 
 
+def _ngrams(text: str, n: int = 3) -> Set[str]:
+    """Return the set of character n-grams in text."""
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
 class WorkflowLibrary:
     """Manages a collection of workflow definitions."""
     
@@ -312,6 +318,8 @@ class WorkflowLibrary:
         
         # Index of workflows
         self.index: Dict[str, Dict[str, Any]] = {}
+        # Trigram -> workflow IDs over lowercased name and goal, for search
+        self._ngram_index: Dict[str, Set[str]] = defaultdict(set)
         self._build_index()
         
         logger.info(f"WorkflowLibrary initialized at {self.storage_path}")
@@ -330,7 +338,7 @@ class WorkflowLibrary:
         filepath = workflow.save(self.storage_path)
         
         # Update index
-        self.index[workflow.id] = workflow.get_summary()
+        self._set_summary(workflow.id, workflow.get_summary())
         self._save_index()
         
         return filepath
@@ -398,8 +406,17 @@ class WorkflowLibrary:
         """
         query_lower = query.lower()
         
+        # Narrow candidates via trigram posting lists; short queries scan everything
+        grams = _ngrams(query_lower)
+        if grams:
+            postings = sorted((self._ngram_index.get(g, set()) for g in grams), key=len)
+            candidate_ids = set(postings[0]).intersection(*postings[1:])
+            candidates = [self.index[wid] for wid in candidate_ids]
+        else:
+            candidates = list(self.index.values())
+        
         results = [
-            summary for summary in self.index.values()
+            summary for summary in candidates
             if query_lower in summary['name'].lower() or query_lower in summary['goal'].lower()
         ]
         
@@ -424,7 +441,7 @@ class WorkflowLibrary:
             logger.info(f"Deleted workflow file: {filepath}")
         
         # Remove from index
-        del self.index[workflow_id]
+        self._unindex_text(workflow_id, self.index.pop(workflow_id))
         self._save_index()
         
         return True
@@ -437,10 +454,34 @@ class WorkflowLibrary:
             
             try:
                 workflow = WorkflowDefinition.load(filepath)
-                self.index[workflow.id] = workflow.get_summary()
+                self._set_summary(workflow.id, workflow.get_summary())
             except Exception as e:
                 logger.error(f"Failed to load workflow from {filepath}: {e}")
     
+    def _set_summary(self, workflow_id: str, summary: Dict[str, Any]) -> None:
+        """Store a workflow summary and refresh its search trigrams."""
+        previous = self.index.get(workflow_id)
+        if previous is not None:
+            self._unindex_text(workflow_id, previous)
+        
+        self.index[workflow_id] = summary
+        for gram in self._search_grams(summary):
+            self._ngram_index[gram].add(workflow_id)
+    
+    def _unindex_text(self, workflow_id: str, summary: Dict[str, Any]) -> None:
+        """Remove a workflow's trigrams from the search index."""
+        for gram in self._search_grams(summary):
+            ids = self._ngram_index.get(gram)
+            if ids is not None:
+                ids.discard(workflow_id)
+                if not ids:
+                    del self._ngram_index[gram]
+    
+    @staticmethod
+    def _search_grams(summary: Dict[str, Any]) -> Set[str]:
+        """Trigrams of the searchable fields (name and goal) of a summary."""
+        return _ngrams(summary['name'].lower()) | _ngrams(summary['goal'].lower())
+    
     def _save_index(self) -> None:
         """Save the workflow index."""
         index_file = self.storage_path / "index.json"
@@ -175,21 +175,10 @@ class EpisodicMemory:
             logger.debug("Episodic recall disabled, episode not stored")
             return None
         
-        # Guardrail: Check for secrets in content
-        combined_text = f"{observation} {reasoning} {json.dumps(action)}"
-        if self._contains_secrets(combined_text):
-            logger.warning("Episode contains potential secrets, not storing")
+        episode = self._build_episode(observation, reasoning, action, result, metadata)
+        if episode is None:
             return None
         
-        # Create episode
-        episode = Episode.create(
-            observation=observation,
-            reasoning=reasoning,
-            action=action,
-            result=result,
-            metadata=metadata or {}
-        )
-        
         self.episodes.append(episode)
         
         # Enforce max episodes limit
@@ -203,6 +192,73 @@ class EpisodicMemory:
         logger.debug(f"Added episode {episode.id}")
         return episode
     
+    def add_episodes_bulk(self, episodes: List[Dict[str, Any]]) -> List[Episode]:
+        """
+        Add several episodes at once.
+        
+        Each dict takes the same keys as add_episode(). Episodes go through the
+        same secret guardrail, but the max-episodes limit is enforced once for
+        the whole batch.
+        
+        Args:
+            episodes: Episode field dicts (observation, reasoning, action, ...)
+            
+        Returns:
+            List of stored Episodes
+        """
+        if not self.enable_recall:
+            logger.debug("Episodic recall disabled, episodes not stored")
+            return []
+        
+        added = []
+        for fields in episodes:
+            episode = self._build_episode(
+                fields.get('observation', ''),
+                fields.get('reasoning', ''),
+                fields.get('action', {}),
+                fields.get('result'),
+                fields.get('metadata')
+            )
+            if episode is not None:
+                added.append(episode)
+        
+        self.episodes.extend(added)
+        
+        # Enforce max episodes limit
+        excess = len(self.episodes) - self.max_episodes
+        if excess > 0:
+            del self.episodes[:excess]
+            logger.debug(f"Removed {excess} oldest episodes (max limit reached)")
+        
+        for episode in added:
+            self._persist_episode(episode)
+        
+        logger.debug(f"Added {len(added)} episodes")
+        return added
+    
+    def _build_episode(
+        self,
+        observation: str,
+        reasoning: str,
+        action: Dict[str, Any],
+        result: Optional[str],
+        metadata: Optional[Dict]
+    ) -> Optional[Episode]:
+        """Create an Episode, or None if the content looks like it holds secrets."""
+        # Guardrail: Check for secrets in content
+        combined_text = f"{observation} {reasoning} {json.dumps(action)}"
+        if self._contains_secrets(combined_text):
+            logger.warning("Episode contains potential secrets, not storing")
+            return None
+        
+        return Episode.create(
+            observation=observation,
+            reasoning=reasoning,
+            action=action,
+            result=result,
+            metadata=metadata or {}
+        )
+    
     def retrieve_relevant(
         self,
         query: str,
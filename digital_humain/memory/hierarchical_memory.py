@@ -73,6 +73,9 @@ class AgentKnowledgeBase:
         self.index_file = self.storage_path / "index.json"
         self.index: Dict[str, Dict[str, Any]] = self._load_index()
         
+        # Running total of indexed page sizes, kept in step with store/delete
+        self._total_size = sum(meta['size_bytes'] for meta in self.index.values())
+        
         logger.info(f"AgentKnowledgeBase initialized at {self.storage_path}")
         logger.info(f"Loaded {len(self.index)} entries from index")
     
@@ -89,6 +92,10 @@ class AgentKnowledgeBase:
             json.dump(page.model_dump(), f, indent=2)
         
         # Update index
+        previous = self.index.get(page.id)
+        if previous is not None:
+            self._total_size -= previous['size_bytes']
+        self._total_size += page.size_bytes
         self.index[page.id] = {
             "timestamp": page.timestamp,
             "priority": page.priority,
@@ -146,7 +153,7 @@ class AgentKnowledgeBase:
         if filepath.exists():
             filepath.unlink()
         
-        del self.index[page_id]
+        self._total_size -= self.index.pop(page_id)['size_bytes']
         self._save_index()
         
         logger.debug(f"Deleted page {page_id} from AKB")
@@ -193,7 +200,7 @@ class AgentKnowledgeBase:
     
     def get_stats(self) -> Dict[str, Any]:
         """Get statistics about the knowledge base."""
-        total_size = sum(meta['size_bytes'] for meta in self.index.values())
+        total_size = self._total_size
         total_accesses = sum(meta['access_count'] for meta in self.index.values())
         
         return {
@@ -279,6 +286,11 @@ class HierarchicalMemoryManager:
         """
         page = MemoryPage.create(content, priority, metadata)
         
+        # Replacing a key releases the old page's bytes first
+        previous = self.main_context.pop(key, None)
+        if previous is not None:
+            self.main_context_size -= previous.size_bytes
+        
         # Check if we need to page out before adding
         if self.main_context_size + page.size_bytes > self.max_main_context_size:
             self._auto_page_out()
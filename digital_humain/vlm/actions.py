@@ -48,13 +48,19 @@ class GUIActions:
         pyautogui.PAUSE = pause
         pyautogui.FAILSAFE = safe_mode
         self.action_history: List[Dict[str, Any]] = []
-        self.show_overlay = show_overlay and OVERLAY_AVAILABLE
-        self.overlay = get_overlay() if self.show_overlay else None
+        self.overlay = None
+        self.set_overlay(show_overlay)
+        
+        logger.info(f"Initialized GUIActions (pause={pause}s, safe_mode={safe_mode}, overlay={self.show_overlay})")
+    
+    def set_overlay(self, enabled: bool) -> None:
+        """Turn the visual action overlay on or off for later actions."""
+        self.show_overlay = enabled and OVERLAY_AVAILABLE
+        if self.show_overlay and self.overlay is None:
+            self.overlay = get_overlay()
         
         if self.show_overlay and self.overlay and not self.overlay.is_running:
             self.overlay.start()
-        
-        logger.info(f"Initialized GUIActions (pause={pause}s, safe_mode={safe_mode}, overlay={self.show_overlay})")
     
     def _log_action(self, action_type: ActionType, params: Dict[str, Any]) -> None:
         """Log executed action."""
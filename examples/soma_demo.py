@@ -8,17 +8,22 @@ This example demonstrates the key components of the SOMA architecture:
 4. Workflow Definition Language (WDL) for learned workflows
 """
 
+import io
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-def demo_orchestration_engine():
+
+def demo_orchestration_engine() -> str:
     """Demonstrate Orchestration Engine capabilities."""
-    print("\n" + "="*60)
-    print("1. ORCHESTRATION ENGINE (OE) DEMONSTRATION")
-    print("="*60)
+    out = io.StringIO()
+    print("\n" + "="*60, file=out)
+    print("1. ORCHESTRATION ENGINE (OE) DEMONSTRATION", file=out)
+    print("="*60, file=out)
     
     from digital_humain.core.orchestration_engine import OrchestrationEngine
     from digital_humain.tools.base import ToolRegistry
@@ -28,32 +33,35 @@ def demo_orchestration_engine():
     
     # Decompose a complex task
     task = "Open browser, navigate to example.com, fill out contact form, and submit"
-    print(f"\n📋 Original Task: {task}")
+    print(f"\n📋 Original Task: {task}", file=out)
     
     decomposition = oe.decompose_task(task)
     
-    print(f"\n✅ Task decomposed into {len(decomposition.subtasks)} subtasks:")
+    print(f"\n✅ Task decomposed into {len(decomposition.subtasks)} subtasks:", file=out)
     for i, subtask in enumerate(decomposition.subtasks, 1):
-        print(f"   {i}. {subtask.description}")
-        print(f"      Role: {subtask.role.value}")
-        print(f"      Priority: {subtask.priority.value}")
-        print(f"      Tools: {', '.join(subtask.tools_required)}")
+        print(f"   {i}. {subtask.description}", file=out)
+        print(f"      Role: {subtask.role.value}", file=out)
+        print(f"      Priority: {subtask.priority.value}", file=out)
+        print(f"      Tools: {', '.join(subtask.tools_required)}", file=out)
     
-    print(f"\n📊 Execution Order: {' → '.join(decomposition.execution_order)}")
-    print(f"⏱️  Estimated Steps: {decomposition.total_estimated_steps}")
+    print(f"\n📊 Execution Order: {' → '.join(decomposition.execution_order)}", file=out)
+    print(f"⏱️  Estimated Steps: {decomposition.total_estimated_steps}", file=out)
     
     # Get stats
     stats = oe.get_stats()
-    print(f"\n📈 OE Stats:")
-    print(f"   - Total tools available: {stats['tool_registry']['total_tools']}")
-    print(f"   - Subtasks created: {stats['subtasks_created']}")
+    print(f"\n📈 OE Stats:", file=out)
+    print(f"   - Total tools available: {stats['tool_registry']['total_tools']}", file=out)
+    print(f"   - Subtasks created: {stats['subtasks_created']}", file=out)
+    
+    return out.getvalue()
 
 
-def demo_hierarchical_memory():
+def demo_hierarchical_memory() -> str:
     """Demonstrate Hierarchical Memory Manager capabilities."""
-    print("\n" + "="*60)
-    print("2. HIERARCHICAL MEMORY MANAGER (HMM) DEMONSTRATION")
-    print("="*60)
+    out = io.StringIO()
+    print("\n" + "="*60, file=out)
+    print("2. HIERARCHICAL MEMORY MANAGER (HMM) DEMONSTRATION", file=out)
+    print("="*60, file=out)
     
     from digital_humain.memory.hierarchical_memory import HierarchicalMemoryManager
     
@@ -63,7 +71,7 @@ def demo_hierarchical_memory():
         page_size=1000
     )
     
-    print("\n📝 Adding items to main context...")
+    print("\n📝 Adding items to main context...", file=out)
     
     # Add items to context
     hmm.add_to_context("task_1", {"description": "Login task", "status": "completed"}, priority=8)
@@ -73,45 +81,48 @@ def demo_hierarchical_memory():
     
     # Get stats
     stats = hmm.get_stats()
-    print(f"\n📊 Main Context Stats:")
-    print(f"   - Items: {stats['main_context']['items']}")
-    print(f"   - Size: {stats['main_context']['size_bytes']} bytes")
-    print(f"   - Utilization: {stats['main_context']['utilization']*100:.1f}%")
+    print(f"\n📊 Main Context Stats:", file=out)
+    print(f"   - Items: {stats['main_context']['items']}", file=out)
+    print(f"   - Size: {stats['main_context']['size_bytes']} bytes", file=out)
+    print(f"   - Utilization: {stats['main_context']['utilization']*100:.1f}%", file=out)
     
-    print(f"\n💾 AKB Stats:")
-    print(f"   - Pages: {stats['akb']['total_pages']}")
-    print(f"   - Size: {stats['akb']['total_size_mb']:.2f} MB")
+    print(f"\n💾 AKB Stats:", file=out)
+    print(f"   - Pages: {stats['akb']['total_pages']}", file=out)
+    print(f"   - Size: {stats['akb']['total_size_mb']:.2f} MB", file=out)
     
     # Add large item to trigger paging
-    print("\n➕ Adding large item (will trigger auto page-out)...")
+    print("\n➕ Adding large item (will trigger auto page-out)...", file=out)
     large_content = {"data": "x" * 3000, "type": "large_task"}
     hmm.add_to_context("large_task", large_content, priority=7)
     
     stats = hmm.get_stats()
-    print(f"\n📤 After paging:")
-    print(f"   - Page-out count: {stats['paging']['page_out_count']}")
-    print(f"   - Page-in count: {stats['paging']['page_in_count']}")
-    print(f"   - Main context items: {stats['main_context']['items']}")
-    print(f"   - AKB pages: {stats['akb']['total_pages']}")
+    print(f"\n📤 After paging:", file=out)
+    print(f"   - Page-out count: {stats['paging']['page_out_count']}", file=out)
+    print(f"   - Page-in count: {stats['paging']['page_in_count']}", file=out)
+    print(f"   - Main context items: {stats['main_context']['items']}", file=out)
+    print(f"   - AKB pages: {stats['akb']['total_pages']}", file=out)
     
     # Search and page in
-    print("\n🔍 Searching AKB for 'navigation'...")
+    print("\n🔍 Searching AKB for 'navigation'...", file=out)
     page_ids = hmm.search_and_page_in("navigation", limit=2)
-    print(f"   - Paged in {len(page_ids)} items")
+    print(f"   - Paged in {len(page_ids)} items", file=out)
+    
+    return out.getvalue()
 
 
-def demo_audit_recovery_engine():
+def demo_audit_recovery_engine() -> str:
     """Demonstrate Audit & Recovery Engine capabilities."""
-    print("\n" + "="*60)
-    print("3. AUDIT & RECOVERY ENGINE (ARE) DEMONSTRATION")
-    print("="*60)
+    out = io.StringIO()
+    print("\n" + "="*60, file=out)
+    print("3. AUDIT & RECOVERY ENGINE (ARE) DEMONSTRATION", file=out)
+    print("="*60, file=out)
     
     from digital_humain.core.audit_recovery import AuditRecoveryEngine
     
     # Create audit engine
     are = AuditRecoveryEngine(checkpoint_cadence=3)
     
-    print("\n📝 Logging reasoning chains...")
+    print("\n📝 Logging reasoning chains...", file=out)
     
     # Log several reasoning steps
     steps = [
@@ -155,7 +166,7 @@ def demo_audit_recovery_engine():
             result=step_data["result"]
         )
         
-        print(f"   Step {i}: {step_data['observation'][:40]}... (confidence: {step_data['confidence']})")
+        print(f"   Step {i}: {step_data['observation'][:40]}... (confidence: {step_data['confidence']})", file=out)
         
         # Create checkpoint if needed
         if are.should_checkpoint(i):
@@ -164,32 +175,35 @@ def demo_audit_recovery_engine():
                 step=i,
                 state_snapshot={"authenticated": False, "step": i}
             )
-            print(f"      ✅ Checkpoint created at step {i}")
+            print(f"      ✅ Checkpoint created at step {i}", file=out)
     
     # Get stats
     stats = are.get_stats()
-    print(f"\n📊 ARE Stats:")
-    print(f"   - Total logs: {stats['total_logs']}")
-    print(f"   - Total checkpoints: {stats['total_checkpoints']}")
-    print(f"   - Average confidence: {stats['average_confidence']:.2f}")
-    print(f"   - Error count: {stats['error_count']}")
+    print(f"\n📊 ARE Stats:", file=out)
+    print(f"   - Total logs: {stats['total_logs']}", file=out)
+    print(f"   - Total checkpoints: {stats['total_checkpoints']}", file=out)
+    print(f"   - Average confidence: {stats['average_confidence']:.2f}", file=out)
+    print(f"   - Error count: {stats['error_count']}", file=out)
     
     # Simulate error and get recovery context
-    print("\n⚠️  Simulating error and generating recovery context...")
+    print("\n⚠️  Simulating error and generating recovery context...", file=out)
     recovery_ctx = are.get_recovery_context("Login failed - invalid credentials", recent_steps=2)
     
-    print(f"\n🔄 Recovery Context:")
-    print(f"   - Error: {recovery_ctx['error']}")
-    print(f"   - Recent reasoning steps: {len(recovery_ctx['recent_reasoning'])}")
+    print(f"\n🔄 Recovery Context:", file=out)
+    print(f"   - Error: {recovery_ctx['error']}", file=out)
+    print(f"   - Recent reasoning steps: {len(recovery_ctx['recent_reasoning'])}", file=out)
     for r in recovery_ctx['recent_reasoning']:
-        print(f"      • Step {r['step']}: {r['reasoning'][:50]}...")
+        print(f"      • Step {r['step']}: {r['reasoning'][:50]}...", file=out)
+    
+    return out.getvalue()
 
 
-def demo_workflow_definition():
+def demo_workflow_definition() -> str:
     """Demonstrate Workflow Definition Language."""
-    print("\n" + "="*60)
-    print("4. WORKFLOW DEFINITION LANGUAGE (WDL) DEMONSTRATION")
-    print("="*60)
+    out = io.StringIO()
+    print("\n" + "="*60, file=out)
+    print("4. WORKFLOW DEFINITION LANGUAGE (WDL) DEMONSTRATION", file=out)
+    print("="*60, file=out)
     
     from digital_humain.learning.workflow_definition import (
         WorkflowDefinition,
@@ -201,7 +215,7 @@ def demo_workflow_definition():
         WorkflowLibrary
     )
     
-    print("\n📝 Creating a workflow definition...")
+    print("\n📝 Creating a workflow definition...", file=out)
     
     # Create narrative memory (the 'why')
     narrative = NarrativeMemory(
@@ -289,46 +303,65 @@ def demo_workflow_definition():
         author="demo_user"
     )
     
-    print(f"\n✅ Workflow Created:")
-    print(f"   - ID: {workflow.id}")
-    print(f"   - Name: {workflow.name}")
-    print(f"   - Version: {workflow.version}")
-    print(f"   - Steps: {len(workflow.steps)}")
+    print(f"\n✅ Workflow Created:", file=out)
+    print(f"   - ID: {workflow.id}", file=out)
+    print(f"   - Name: {workflow.name}", file=out)
+    print(f"   - Version: {workflow.version}", file=out)
+    print(f"   - Steps: {len(workflow.steps)}", file=out)
     
     # Get workflow summary
     summary = workflow.get_summary()
-    print(f"\n📊 Workflow Summary:")
-    print(f"   - Goal: {summary['goal']}")
-    print(f"   - Total actions: {summary['total_actions']}")
-    print(f"   - Category: {summary['category']}")
-    print(f"   - Difficulty: {summary['difficulty']}")
-    print(f"   - Tags: {', '.join(summary['tags'])}")
+    print(f"\n📊 Workflow Summary:", file=out)
+    print(f"   - Goal: {summary['goal']}", file=out)
+    print(f"   - Total actions: {summary['total_actions']}", file=out)
+    print(f"   - Category: {summary['category']}", file=out)
+    print(f"   - Difficulty: {summary['difficulty']}", file=out)
+    print(f"   - Tags: {', '.join(summary['tags'])}", file=out)
     
     # Validate workflow
     is_valid, errors = workflow.validate()
-    print(f"\n✅ Validation: {'PASSED' if is_valid else 'FAILED'}")
+    print(f"\n✅ Validation: {'PASSED' if is_valid else 'FAILED'}", file=out)
     if errors:
         for error in errors:
-            print(f"   ⚠️  {error}")
+            print(f"   ⚠️  {error}", file=out)
     
-    print("\n📚 Creating workflow library...")
+    print("\n📚 Creating workflow library...", file=out)
     import tempfile
-    with tempfile.TemporaryDirectory() as tmpdir:
+    # Keep the scratch library on tmpfs when available so the demo never touches disk
+    tmp_kwargs = {"dir": "/dev/shm" if os.path.isdir("/dev/shm") else None}
+    if sys.version_info >= (3, 10):
+        tmp_kwargs["ignore_cleanup_errors"] = True
+    with tempfile.TemporaryDirectory(**tmp_kwargs) as tmpdir:
         library = WorkflowLibrary(storage_path=tmpdir)
         
         # Add workflow to library
         saved_path = library.add_workflow(workflow)
-        print(f"   ✅ Workflow saved to: {saved_path}")
+        print(f"   ✅ Workflow saved to: {saved_path}", file=out)
         
         # List workflows
         workflows = library.list_workflows()
-        print(f"\n📋 Workflows in library: {len(workflows)}")
+        print(f"\n📋 Workflows in library: {len(workflows)}", file=out)
         for wf in workflows:
-            print(f"   - {wf['name']} (v{wf['version']}) - {wf['total_steps']} steps")
+            print(f"   - {wf['name']} (v{wf['version']}) - {wf['total_steps']} steps", file=out)
         
         # Search workflows
         search_results = library.search_workflows("login")
-        print(f"\n🔍 Search results for 'login': {len(search_results)} found")
+        print(f"\n🔍 Search results for 'login': {len(search_results)} found", file=out)
+    
+    return out.getvalue()
+
+
+DEMOS = {
+    "oe": demo_orchestration_engine,
+    "hmm": demo_hierarchical_memory,
+    "are": demo_audit_recovery_engine,
+    "wdl": demo_workflow_definition,
+}
+
+
+def _run(name: str) -> str:
+    """Run one demo by key (process-pool entry point) and return its output."""
+    return DEMOS[name]()
 
 
 def main():
@@ -340,10 +373,11 @@ def main():
     print("█"*60)
     
     try:
-        demo_orchestration_engine()
-        demo_hierarchical_memory()
-        demo_audit_recovery_engine()
-        demo_workflow_definition()
+        # Demos are independent, so run them side by side and print in order
+        with ProcessPoolExecutor(max_workers=len(DEMOS)) as pool:
+            for output in pool.map(_run, DEMOS):
+                sys.stdout.write(output)
+        sys.stdout.flush()
         
         print("\n" + "="*60)
         print("✨ ALL DEMONSTRATIONS COMPLETED SUCCESSFULLY!")
@@ -1,11 +1,20 @@
 import tkinter as tk
 from tkinter import ttk, scrolledtext
+import atexit
 import threading
+import queue
 import sys
 import os
+import time
+import json
+import hashlib
+import re
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from collections import OrderedDict, deque
 from pathlib import Path
 from typing import List
-import ollama
 import httpx
 from loguru import logger
 from dotenv import load_dotenv
@@ -22,27 +31,47 @@ sys.path.insert(0, str(Path(__file__).parent))
 # Load environment variables from .env if present
 load_dotenv()
 
-from digital_humain.core.agent import AgentConfig, AgentRole
-from digital_humain.core.llm import OllamaProvider, OpenRouterProvider, LettaProvider
-from digital_humain.core.engine import AgentEngine
-from digital_humain.vlm.screen_analyzer import ScreenAnalyzer
-from digital_humain.vlm.actions import GUIActions
-from digital_humain.tools.base import ToolRegistry
-from digital_humain.tools.file_tools import FileReadTool, FileWriteTool, FileListTool
-from digital_humain.agents.automation_agent import DesktopAutomationAgent
-from digital_humain.utils.config import load_config
-from digital_humain.memory.demonstration import DemonstrationMemory
-from digital_humain.memory.episodic import EpisodicMemory, MemorySummarizer
+# Heavy imports (ollama, digital_humain agents/VLM/tools) are deferred to first use
+# so the Tk window does not wait on numpy/cv2/pyautogui import time.
+
+# Log sink tuning: drain cadence and widget line cap
+LOG_DRAIN_INTERVAL_MS = 100
+LOG_MAX_LINES = 2000
+
+# Seconds a fetched Ollama model list is reused before hitting the server again
+MODEL_CACHE_TTL = 30.0
+
+# Quiet period after the last filter keystroke before the model list is re-filtered
+FILTER_DEBOUNCE_MS = 150
+
+def _make_http_client() -> httpx.Client:
+    """Build the pooled client, using HTTP/2 when the optional h2 package is installed."""
+    kwargs = dict(
+        timeout=20,
+        limits=httpx.Limits(max_keepalive_connections=10, max_connections=20, keepalive_expiry=30.0),
+    )
+    try:
+        return httpx.Client(http2=True, **kwargs)
+    except ImportError:  # httpx[http2] not installed
+        return httpx.Client(**kwargs)
+
+
+# Pooled HTTP client shared by model-list fetches so refreshes reuse the TLS connection
+_HTTP_CLIENT = _make_http_client()
+atexit.register(_HTTP_CLIENT.close)
+
+# Compiled agent engines kept around for reuse, keyed by provider/model/config
+ENGINE_CACHE_SIZE = 8
+
 
 class TextHandler:
-    def __init__(self, text_widget):
-        self.text_widget = text_widget
+    """Loguru sink that queues messages; the GUI drains them on the Tk thread."""
+
+    def __init__(self):
+        self.queue = queue.SimpleQueue()
 
     def write(self, message):
-        self.text_widget.configure(state='normal')
-        self.text_widget.insert(tk.END, message)
-        self.text_widget.see(tk.END)
-        self.text_widget.configure(state='disabled')
+        self.queue.put_nowait(message)
 
 class DigitalHumainGUI:
     def __init__(self, root):
@@ -51,16 +80,51 @@ class DigitalHumainGUI:
         self.root.geometry("1200x850")
         self._init_style()
         self.current_models = []
+        # Filter index over current_models: newline-joined lowercase names, the
+        # start offset of each name in that blob, and a per-model "free" flag
+        self._models_blob = ""
+        self._model_offsets = []
+        self._free_mask = []
+        self._last_filtered = []  # filtered model list waiting to be shown in the dropdown
+        self._shown_values = None  # list currently installed as model_combo values
+        self._models_cache = None  # (fetched_at, model_names) from ollama.list()
+        self._ollama_parser = None  # picks names out of ollama.list(), set on first response
+        self._engine_cache = OrderedDict()  # (provider, model, config digest) -> AgentEngine
+        self._llm_cache = {}  # (provider, model, config digest) -> LLMProvider
+        self.screen_analyzer = None  # screen/GUI/tool helpers are built on first run
+        self.gui_actions = None
+        self.tool_registry = None
+        self._components_lock = threading.Lock()
+        self._recall_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="episodic-recall")
+        self._filter_after_id = None
+        self._load_gen = 0  # bumped by every load_models() call
+        self._demo_cache = None  # demo names shown in the replay combobox, newest first
+        self._config = None  # parsed config/config.yaml, loaded on first use
+        self._config_lock = threading.Lock()
         self.cancel_event = None
         self.agent_thread = None
         
-        # Initialize memory systems
-        self.demo_memory = DemonstrationMemory()
-        self.episodic_memory = EpisodicMemory()
-        self.memory_summarizer = MemorySummarizer()
-        
         self.setup_ui()
         self.load_models()
+        threading.Thread(target=self._prewarm_http, args=(self.provider_var.get(),), daemon=True).start()
+        threading.Thread(target=self._prewarm_components, daemon=True).start()
+
+    # Memory systems are built on first use: importing them loads the agent
+    # engine, langgraph and pyautogui, which would otherwise delay first paint
+    @cached_property
+    def demo_memory(self):
+        from digital_humain.memory.demonstration import DemonstrationMemory
+        return DemonstrationMemory()
+
+    @cached_property
+    def episodic_memory(self):
+        from digital_humain.memory.episodic import EpisodicMemory
+        return EpisodicMemory()
+
+    @cached_property
+    def memory_summarizer(self):
+        from digital_humain.memory.episodic import MemorySummarizer
+        return MemorySummarizer()
 
     def _init_style(self):
         # Dark futuristic palette
@@ -72,6 +136,20 @@ class DigitalHumainGUI:
         subdued = "#a3b7d8"
 
         self.root.configure(bg=bg)
+        self.colors = {
+            "bg": bg,
+            "panel": panel,
+            "accent": accent,
+            "text": text,
+            "subdued": subdued,
+        }
+
+        # ttk styles belong to the Tcl interpreter, so configure them once per
+        # interpreter (flagged with a Tcl variable) rather than once per window
+        if self.root.tk.call("info", "exists", "::digital_humain_styled"):
+            return
+        self.root.tk.setvar("::digital_humain_styled", 1)
+
         style = ttk.Style()
         style.theme_use("clam")
 
@@ -84,14 +162,6 @@ class DigitalHumainGUI:
         style.configure("TCombobox", fieldbackground=panel, background=panel, foreground=text, arrowcolor=accent, selectbackground="#243047", selectforeground=text)
         style.configure("TEntry", fieldbackground=panel, foreground=text, bordercolor=accent, lightcolor=panel, darkcolor=panel)
         style.configure("Vertical.TScrollbar", gripcount=0, background=panel, darkcolor=panel, lightcolor=panel, troughcolor=bg, bordercolor=bg, arrowcolor=accent)
-
-        self.colors = {
-            "bg": bg,
-            "panel": panel,
-            "accent": accent,
-            "text": text,
-            "subdued": subdued,
-        }
         
     def setup_ui(self):
         # Main container
@@ -115,7 +185,9 @@ class DigitalHumainGUI:
 
         ttk.Label(model_frame, text="Model:").grid(row=0, column=2, padx=5, pady=2, sticky="w")
         self.model_var = tk.StringVar()
-        self.model_combo = ttk.Combobox(model_frame, textvariable=self.model_var, state="readonly")
+        # Values are installed lazily when the dropdown opens (see _populate_model_values)
+        self.model_combo = ttk.Combobox(model_frame, textvariable=self.model_var, state="readonly",
+                                        postcommand=self._populate_model_values)
         self.model_combo.grid(row=0, column=3, padx=5, pady=2, sticky="ew")
 
         ttk.Button(model_frame, text="Refresh Models", command=self.load_models).grid(row=0, column=4, padx=5, pady=2)
@@ -130,11 +202,12 @@ class DigitalHumainGUI:
         self.filter_var = tk.StringVar()
         self.filter_entry = ttk.Entry(model_frame, textvariable=self.filter_var)
         self.filter_entry.grid(row=2, column=1, padx=5, pady=2, sticky="ew")
-        self.filter_entry.bind("<KeyRelease>", lambda _e: self.apply_filter())
+        self.filter_entry.bind("<KeyRelease>", self._on_filter_key)
 
         self.free_only = tk.BooleanVar(value=False)
         ttk.Checkbutton(model_frame, text="Free only", variable=self.free_only, command=self.apply_filter).grid(row=2, column=2, padx=5, pady=2, sticky="w")
         ttk.Button(model_frame, text="Apply Filter", command=self.apply_filter).grid(row=2, column=3, padx=5, pady=2)
+        ttk.Button(model_frame, text="Reload Config", command=self.reload_config).grid(row=2, column=4, padx=5, pady=2)
         
         task_frame = ttk.LabelFrame(main_frame, text="Task", padding="8")
         task_frame.pack(fill=tk.X, pady=8)
@@ -152,7 +225,8 @@ class DigitalHumainGUI:
         self.stop_btn = ttk.Button(control_frame, text="Stop", command=self.stop_task, state="disabled")
         self.stop_btn.pack(side=tk.LEFT, padx=5)
 
-        ttk.Button(control_frame, text="Voice Input", command=self.voice_to_text).pack(side=tk.LEFT, padx=5)
+        self.voice_btn = ttk.Button(control_frame, text="Voice Input", command=self.voice_to_text)
+        self.voice_btn.pack(side=tk.LEFT, padx=5)
         ttk.Button(control_frame, text="Clear Logs", command=self.clear_logs).pack(side=tk.LEFT, padx=5)
         
         # Recording & Memory Controls
@@ -202,8 +276,8 @@ class DigitalHumainGUI:
         self.safety_pause_var = tk.BooleanVar(value=True)
         ttk.Checkbutton(mem_settings_frame, text="Safety Pause", variable=self.safety_pause_var).pack(side=tk.LEFT, padx=5)
         
-        # Initialize demo list
-        self.refresh_demos()
+        # Initialize demo list off the Tk thread (building demo_memory is slow)
+        threading.Thread(target=self._list_demos_background, daemon=True).start()
         
         # Logs
         log_frame = ttk.LabelFrame(main_frame, text="Execution Logs", padding="5")
@@ -213,37 +287,128 @@ class DigitalHumainGUI:
         self.log_area.pack(fill=tk.BOTH, expand=True)
         
         # Redirect logger
+        self.log_handler = TextHandler()
         logger.remove()
-        logger.add(TextHandler(self.log_area), format="{time:HH:mm:ss} | {level} | {message}")
+        logger.add(self.log_handler, format="{time:HH:mm:ss} | {level} | {message}")
+        self.root.after(LOG_DRAIN_INTERVAL_MS, self._drain_logs)
+
+    def _drain_logs(self):
+        """Flush queued log messages into the log widget in a single insert."""
+        parts = deque(maxlen=LOG_MAX_LINES)
+        try:
+            while True:
+                parts.append(self.log_handler.queue.get_nowait())
+        except queue.Empty:
+            pass
+
+        # Messages beyond the line cap would be trimmed right away, so the
+        # bounded deque drops them before they ever reach the widget
+        if parts:
+            self.log_area.configure(state='normal')
+            self.log_area.insert(tk.END, ''.join(parts))
+            lines = int(self.log_area.index('end-1c').split('.')[0])
+            if lines > LOG_MAX_LINES:
+                self.log_area.delete('1.0', f'{lines - LOG_MAX_LINES + 1}.0')
+            self.log_area.see(tk.END)
+            self.log_area.configure(state='disabled')
+
+        self.root.after(LOG_DRAIN_INTERVAL_MS, self._drain_logs)
+
+    def get_config(self) -> dict:
+        """Return the parsed config, reading it from disk only on first use."""
+        with self._config_lock:
+            if self._config is None:
+                from digital_humain.utils.config import load_config
+
+                self._config = load_config()
+            return self._config
+
+    def reload_config(self):
+        """Drop the cached config so the next use re-reads it, then refresh models."""
+        with self._config_lock:
+            self._config = None
+        logger.info("Configuration will be reloaded on next use")
+        self.load_models()
+
+    def _prewarm_http(self, provider: str):
+        """Open the pooled OpenRouter connection early so the first real request skips the handshake."""
+        try:
+            llm_cfg = self.get_config().get("llm", {})
+            # Ollama-only setups never talk to OpenRouter, so leave them offline
+            if "openrouter" not in (provider, llm_cfg.get("provider")):
+                return
+            base_url = llm_cfg.get("openrouter", {}).get("base_url", "https://openrouter.ai/api/v1")
+            _HTTP_CLIENT.head(f"{base_url.rstrip('/')}/models", timeout=5)
+        except Exception as e:
+            logger.debug(f"OpenRouter pre-warm skipped: {e}")
 
     def load_models(self):
+        # Each load gets a generation; results from superseded loads are dropped
+        self._load_gen += 1
+        gen = self._load_gen
         provider = self.provider_var.get()
         if provider == "ollama":
-            self._load_ollama_models()
+            self._load_ollama_models(gen)
         elif provider == "openrouter":
-            self._load_openrouter_models()
+            self._load_openrouter_models(gen)
         elif provider == "letta":
-            self._load_letta_models()
+            self._load_letta_models(gen)
 
-    def _load_ollama_models(self):
+    def _load_ollama_models(self, gen: int):
+        if self._models_cache and time.monotonic() - self._models_cache[0] < MODEL_CACHE_TTL:
+            self._apply_models(gen)
+            return
+        threading.Thread(target=self._fetch_models, args=(gen,), daemon=True).start()
+
+    def _fetch_models(self, gen: int):
+        """Query the Ollama server off the Tk thread and hand results back via after()."""
         try:
+            import ollama
+
             response = ollama.list()
-            if hasattr(response, 'models'):
-                model_names = [m.model for m in response.models]
-            else:
-                model_names = [m['model'] for m in response['models']]
-            self.current_models = model_names
-            self.apply_filter()
+            if self._ollama_parser is None:
+                # The client's response shape is fixed per installed SDK; pick the parser once
+                if hasattr(response, 'models'):
+                    self._ollama_parser = lambda r: [m.model for m in r.models]
+                else:
+                    self._ollama_parser = lambda r: [m['model'] for m in r['models']]
+            model_names = self._ollama_parser(response)
+            self._models_cache = (time.monotonic(), model_names)
+            self.root.after(0, self._apply_models, gen)
         except Exception as e:
             logger.error(f"Failed to load Ollama models: {e}")
-            self.model_combo['values'] = ["Error loading models"]
+            self.root.after(0, self._show_models_error, gen)
 
-    def _load_openrouter_models(self):
-        config = load_config()
-        base_url = config.get("llm", {}).get("openrouter", {}).get("base_url", "https://openrouter.ai/api/v1")
+    def _apply_models(self, gen: int):
+        if not self._models_cache:
+            return
+        self._set_models("ollama", list(self._models_cache[1]), gen)
+
+    def _set_models(self, provider: str, models: List[str], gen: int):
+        """Install a fetched model list on the Tk thread, unless a newer load or provider superseded it."""
+        if gen != self._load_gen or self.provider_var.get() != provider:
+            return
+        self.current_models = models
+        lowered = [m.lower() for m in models]
+        self._models_blob = "\n".join(lowered)
+        self._model_offsets = []
+        offset = 0
+        for name in lowered:
+            self._model_offsets.append(offset)
+            offset += len(name) + 1
+        self._free_mask = ["free" in name for name in lowered]
+        self.apply_filter()
+
+    def _load_openrouter_models(self, gen: int):
         api_key = self.api_key_var.get().strip() or os.environ.get("OPENROUTER_API_KEY", "")
+        threading.Thread(target=self._fetch_openrouter_models, args=(api_key, gen), daemon=True).start()
 
-        fallback_models: List[str] = [
+    def _fetch_openrouter_models(self, api_key: str, gen: int):
+        """Fetch the OpenRouter model list off the Tk thread, falling back to a static list."""
+        config = self.get_config()
+        base_url = config.get("llm", {}).get("openrouter", {}).get("base_url", "https://openrouter.ai/api/v1")
+
+        models: List[str] = [
             "openrouter/nvidia/nemotron-nano-12b-v2-vl:free",
             "openrouter/anthropic/claude-3.5-sonnet",
             "openrouter/qwen/qwen-2-7b-instruct",
@@ -256,55 +421,74 @@ class DigitalHumainGUI:
             if api_key:
                 headers["Authorization"] = f"Bearer {api_key}"
 
-            with httpx.Client(timeout=20) as client:
-                resp = client.get(url, headers=headers)
-                resp.raise_for_status()
-                data = resp.json().get("data", [])
-                models = [item.get("id") for item in data if item.get("id")]
-                if models:
-                    self.current_models = models
-                    self.apply_filter()
-                    return
+            resp = _HTTP_CLIENT.get(url, headers=headers)
+            resp.raise_for_status()
+            data = resp.json().get("data", [])
+            models = [item.get("id") for item in data if item.get("id")] or models
         except Exception as e:
             logger.warning(f"OpenRouter model fetch failed, using fallback list: {e}")
 
-        self.current_models = fallback_models
-        self.apply_filter()
+        self.root.after(0, self._set_models, "openrouter", models, gen)
 
-    def _load_letta_models(self):
+    def _load_letta_models(self, gen: int):
         # Letta uses server-side model selection; we surface a safe default list (free-first)
-        cfg = load_config()
+        cfg = self.get_config()
         default_model = cfg.get("llm", {}).get("letta", {}).get("default_model", "openrouter/nvidia/nemotron-nano-12b-v2-vl:free")
-        self.current_models = [
+        models = [
             "openrouter/nvidia/nemotron-nano-12b-v2-vl:free",
             "openrouter/amazon/nova-2-lite-v1:free",
             "openrouter/qwen/qwen-2-7b-instruct",
             "openrouter/deepseek/deepseek-chat",
         ]
         # Put configured default first if present
-        if default_model in self.current_models:
-            self.current_models.remove(default_model)
-            self.current_models.insert(0, default_model)
+        if default_model in models:
+            models.remove(default_model)
+            models.insert(0, default_model)
+        self._set_models("letta", models, gen)
+
+    def _on_filter_key(self, _event=None):
+        """Coalesce filter keystrokes so only the last one re-filters the list."""
+        if self._filter_after_id is not None:
+            self.root.after_cancel(self._filter_after_id)
+        self._filter_after_id = self.root.after(FILTER_DEBOUNCE_MS, self._run_debounced_filter)
+
+    def _run_debounced_filter(self):
+        self._filter_after_id = None
         self.apply_filter()
 
     def apply_filter(self):
-        models = getattr(self, "current_models", [])
+        models = self.current_models
         query = self.filter_var.get().lower()
         free_only = self.free_only.get()
 
-        def match(m: str) -> bool:
-            if free_only and "free" not in m.lower():
-                return False
-            if query and query not in m.lower():
-                return False
-            return True
-
-        filtered = [m for m in models if match(m)]
+        if query:
+            # One C-level scan of the blob; each hit maps back to its model by offset
+            hits = sorted({
+                bisect_right(self._model_offsets, m.start()) - 1
+                for m in re.finditer(re.escape(query), self._models_blob)
+            })
+        else:
+            hits = range(len(models))
+        filtered = [models[i] for i in hits if not free_only or self._free_mask[i]]
         if not filtered and models:
             filtered = models  # fallback to full list if filter empty
-        self.model_combo['values'] = filtered
-        if filtered:
-            self.model_combo.set(filtered[0])
+        if filtered == self._last_filtered:
+            return
+        self._last_filtered = filtered
+        # Keep the user's pick when it survives the new filter
+        if filtered and self.model_var.get() not in filtered:
+            self.model_var.set(filtered[0])
+
+    def _populate_model_values(self):
+        """Install the pending filtered list just before the model dropdown opens."""
+        if self._shown_values is not self._last_filtered:
+            self.model_combo['values'] = self._last_filtered
+            self._shown_values = self._last_filtered
+
+    def _show_models_error(self, gen: int):
+        if gen != self._load_gen:
+            return
+        self._last_filtered = ["Error loading models"]
 
     def clear_logs(self):
         self.log_area.configure(state='normal')
@@ -338,46 +522,99 @@ class DigitalHumainGUI:
         else:
             logger.info("No active task to stop")
 
+    def _prewarm_components(self):
+        """Build the shared tool registry (and its imports) in the background after startup."""
+        try:
+            self._shared_tool_registry()
+        except Exception as e:
+            logger.debug(f"Tool registry pre-warm skipped: {e}")
+
+    def _shared_tool_registry(self):
+        """Build the file tool registry once and share it across runs."""
+        with self._components_lock:
+            if self.tool_registry is None:
+                from digital_humain.tools.base import ToolRegistry
+                from digital_humain.tools.file_tools import FileReadTool, FileWriteTool
+
+                tool_registry = ToolRegistry()
+                tool_registry.register(FileReadTool())
+                tool_registry.register(FileWriteTool())
+                self.tool_registry = tool_registry
+            return self.tool_registry
+
+    def _shared_components(self):
+        """Build the screen analyzer and GUI actions on the first run and share them."""
+        tool_registry = self._shared_tool_registry()
+        with self._components_lock:
+            if self.screen_analyzer is None:
+                from digital_humain.vlm.screen_analyzer import ScreenAnalyzer
+                from digital_humain.vlm.actions import GUIActions
+
+                self.gui_actions = GUIActions(pause=1.0)  # Slower for safety
+                self.screen_analyzer = ScreenAnalyzer(save_screenshots=False)
+            return self.screen_analyzer, self.gui_actions, tool_registry
+
+    @staticmethod
+    def _config_digest(config, api_key: str = "") -> str:
+        """Stable digest of the loaded config and API key, used to key the engine cache."""
+        blob = json.dumps([config, api_key], sort_keys=True, default=str)
+        return hashlib.sha1(blob.encode()).hexdigest()
+
     def run_agent(self, task, model, provider, cancel_event):
         try:
+            from digital_humain.core.agent import AgentConfig, AgentRole
+            from digital_humain.core.engine import AgentEngine
+            from digital_humain.agents.automation_agent import DesktopAutomationAgent
+
             logger.info(f"Starting task with provider={provider}, model={model}")
             
-            # Initialize components
-            config = load_config()
-            llm = self._build_llm(provider, model, config)
-            
-            screen_analyzer = ScreenAnalyzer(
-                save_screenshots=True,
-                screenshot_dir="./screenshots"
-            )
-            
-            gui_actions = GUIActions(pause=1.0)  # Slower for safety
-            
-            tool_registry = ToolRegistry()
-            tool_registry.register(FileReadTool())
-            tool_registry.register(FileWriteTool())
+            # Episode recall doesn't depend on the engine, so overlap it with the build
+            recall = None
+            if self.episodic_memory.enable_recall:
+                recall = self._recall_pool.submit(self.episodic_memory.retrieve_relevant, task, 3)
             
-            agent_config = AgentConfig(
-                name="gui_agent",
-                role=AgentRole.EXECUTOR,
-                model=model,
-                max_iterations=15
-            )
+            config = self.get_config()
+            key = (provider, model, self._config_digest(config, self.api_key_var.get().strip()))
+            engine = self._engine_cache.get(key)
             
-            agent = DesktopAutomationAgent(
-                config=agent_config,
-                llm_provider=llm,
-                screen_analyzer=screen_analyzer,
-                gui_actions=gui_actions,
-                tool_registry=tool_registry
-            )
+            if engine is None:
+                # Initialize components
+                llm = self._build_llm(provider, model, config)
+                
+                screen_analyzer, gui_actions, tool_registry = self._shared_components()
+                
+                agent_config = AgentConfig(
+                    name="gui_agent",
+                    role=AgentRole.EXECUTOR,
+                    model=model,
+                    max_iterations=15
+                )
+                
+                agent = DesktopAutomationAgent(
+                    config=agent_config,
+                    llm_provider=llm,
+                    screen_analyzer=screen_analyzer,
+                    gui_actions=gui_actions,
+                    tool_registry=tool_registry
+                )
+                
+                engine = AgentEngine(agent)
+                engine.build_graph()
+                
+                self._engine_cache[key] = engine
+                if len(self._engine_cache) > ENGINE_CACHE_SIZE:
+                    self._engine_cache.popitem(last=False)
+            else:
+                self._engine_cache.move_to_end(key)
+                logger.debug(f"Reusing compiled engine for {provider}/{model}")
             
-            engine = AgentEngine(agent, cancel_event=cancel_event)
-            engine.build_graph()
+            # The compiled graph is reused; only the cancel flag is per-run
+            engine.cancel_event = cancel_event
+            self.gui_actions.clear_history()  # action history stays per run
             
             # Retrieve relevant past episodes if enabled
-            if self.episodic_memory.enable_recall:
-                relevant_episodes = self.episodic_memory.retrieve_relevant(task, top_k=3)
+            if recall is not None:
+                relevant_episodes = recall.result()
                 if relevant_episodes:
                     logger.info(f"Retrieved {len(relevant_episodes)} relevant past episodes")
                     for ep in relevant_episodes:
@@ -387,14 +624,17 @@ class DigitalHumainGUI:
             
             # Store episode in episodic memory if enabled
             if self.episodic_memory.enable_recall and result.get('history'):
-                for step in result['history']:
-                    self.episodic_memory.add_episode(
-                        observation=step.get('observation', ''),
-                        reasoning=step.get('reasoning', ''),
-                        action=step.get('action', {}),
-                        result=str(step.get('action', {}).get('success', False)),
-                        metadata={'task': task, 'model': model, 'provider': provider}
-                    )
+                metadata = {'task': task, 'model': model, 'provider': provider}
+                self.episodic_memory.add_episodes_bulk([
+                    {
+                        'observation': step.get('observation', ''),
+                        'reasoning': step.get('reasoning', ''),
+                        'action': step.get('action', {}),
+                        'result': str(step.get('action', {}).get('success', False)),
+                        'metadata': dict(metadata)
+                    }
+                    for step in result['history']
+                ])
             
             if result['error']:
                 logger.error(f"Task failed: {result['error']}")
@@ -418,6 +658,16 @@ class DigitalHumainGUI:
         self.agent_thread = None
 
     def _build_llm(self, provider: str, model: str, config: dict):
+        # Reuse provider instances so their keep-alive HTTP connection stays warm
+        key = (provider, model, self._config_digest(config, self.api_key_var.get().strip()))
+        llm = self._llm_cache.get(key)
+        if llm is None:
+            llm = self._llm_cache[key] = self._create_llm(provider, model, config)
+        return llm
+
+    def _create_llm(self, provider: str, model: str, config: dict):
+        from digital_humain.core.llm import OllamaProvider, OpenRouterProvider, LettaProvider
+
         if provider == "openrouter":
             or_cfg = config.get("llm", {}).get("openrouter", {})
             api_key = self.api_key_var.get().strip() or os.environ.get("OPENROUTER_API_KEY", "")
@@ -464,6 +714,11 @@ class DigitalHumainGUI:
         if sr is None:
             logger.error("speech_recognition not installed. Run: pip install SpeechRecognition pyaudio")
             return
+        # Capture and recognition can take seconds; keep the Tk loop free
+        self.voice_btn.configure(state='disabled')
+        threading.Thread(target=self._voice_to_text_worker, daemon=True).start()
+
+    def _voice_to_text_worker(self):
         try:
             recognizer = sr.Recognizer()
             with sr.Microphone() as source:
@@ -471,11 +726,16 @@ class DigitalHumainGUI:
                 audio = recognizer.listen(source, phrase_time_limit=10)
             text = recognizer.recognize_google(audio, language="en-US")
             if text:
-                self.task_text.delete("1.0", tk.END)
-                self.task_text.insert("1.0", text)
+                self.root.after(0, self._set_task_text, text)
                 logger.info(f"Voice captured: {text}")
         except Exception as e:
             logger.error(f"Voice capture failed: {e}")
+        finally:
+            self.root.after(0, lambda: self.voice_btn.configure(state='normal'))
+
+    def _set_task_text(self, text: str):
+        self.task_text.delete("1.0", tk.END)
+        self.task_text.insert("1.0", text)
     
     def toggle_recording(self):
         """Toggle recording on/off."""
@@ -496,18 +756,35 @@ class DigitalHumainGUI:
             if demo_name and actions:
                 self.demo_memory.save_demonstration(demo_name, actions)
                 logger.success(f"Recording saved as '{demo_name}' with {len(actions)} actions")
-                self.refresh_demos()
+                # Newest first, matching list_demonstrations(); saving a name again overwrites it
+                names = [n for n in self._demo_cache or [] if n != demo_name]
+                self._show_demos([demo_name] + names)
             else:
                 logger.warning("No demo name provided or no actions recorded")
     
     def refresh_demos(self):
-        """Refresh the list of available demonstrations."""
+        """Rescan the demonstration store and refresh the list."""
         demos = self.demo_memory.list_demonstrations()
-        demo_names = [demo['name'] for demo in demos]
+        self._show_demos([demo['name'] for demo in demos])
+        logger.debug(f"Refreshed demo list: {len(self._demo_cache)} demonstrations")
+    
+    def _list_demos_background(self):
+        """Build the demonstration store off the Tk thread and show its demos via after()."""
+        try:
+            demos = self.demo_memory.list_demonstrations()
+        except Exception as e:
+            logger.error(f"Failed to list demonstrations: {e}")
+            return
+        self.root.after(0, self._show_demos, [demo['name'] for demo in demos])
+    
+    def _show_demos(self, demo_names):
+        """Cache the demo names and show them, so save/delete need no rescan."""
+        self._demo_cache = demo_names
         self.demo_combo['values'] = demo_names
         if demo_names:
             self.demo_combo.set(demo_names[0])
-        logger.debug(f"Refreshed demo list: {len(demo_names)} demonstrations")
+        else:
+            self.demo_combo.set("")
     
     def replay_demo(self):
         """Replay the selected demonstration."""
@@ -540,15 +817,21 @@ class DigitalHumainGUI:
             logger.warning("No demonstration selected")
             return
         
-        results = self.demo_memory.replay_demonstration(
-            demo_name,
-            dry_run=True,
-            safety_pause=False
-        )
+        def dry_run_thread():
+            try:
+                results = self.demo_memory.replay_demonstration(
+                    demo_name,
+                    dry_run=True,
+                    safety_pause=False
+                )
+                # One log record for the whole plan instead of one per step
+                lines = [f"DRY RUN for '{demo_name}':"]
+                lines.extend(f"  {i+1}. {result['action']}: {result['params']}" for i, result in enumerate(results))
+                logger.info("\n".join(lines))
+            except Exception as e:
+                logger.error(f"Dry run failed: {e}")
         
-        logger.info(f"DRY RUN for '{demo_name}':")
-        for i, result in enumerate(results):
-            logger.info(f"  {i+1}. {result['action']}: {result['params']}")
+        threading.Thread(target=dry_run_thread, daemon=True).start()
     
     def delete_demo(self):
         """Delete the selected demonstration."""
@@ -559,7 +842,7 @@ class DigitalHumainGUI:
         
         if self.demo_memory.delete_demonstration(demo_name):
             logger.success(f"Demonstration '{demo_name}' deleted")
-            self.refresh_demos()
+            self._show_demos([n for n in self._demo_cache or [] if n != demo_name])
         else:
             logger.error(f"Failed to delete demonstration '{demo_name}'")
     
@@ -1,19 +1,26 @@
+import asyncio
+import atexit
 import tkinter as tk
 from tkinter import ttk, scrolledtext
 import threading
+import queue
+from concurrent.futures import ThreadPoolExecutor
 import sys
 import os
+import json
+import time
+import hashlib
+from functools import cached_property
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Optional
 import httpx
 from loguru import logger
 from dotenv import load_dotenv
 
-# Optional voice input
 try:
-    import speech_recognition as sr
-except ImportError:  # Voice input stays optional
-    sr = None
+    import orjson  # optional: faster parsing of the large OpenRouter /models payload
+except ImportError:
+    orjson = None
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent))
@@ -23,25 +30,73 @@ load_dotenv()
 
 from digital_humain.core.agent import AgentConfig, AgentRole
 from digital_humain.core.llm import OllamaProvider, OpenRouterProvider, LettaProvider
-from digital_humain.core.engine import AgentEngine
-from digital_humain.vlm.screen_analyzer import ScreenAnalyzer
-from digital_humain.vlm.actions import GUIActions
-from digital_humain.tools.base import ToolRegistry
-from digital_humain.tools.file_tools import FileReadTool, FileWriteTool, FileListTool
-from digital_humain.agents.automation_agent import DesktopAutomationAgent
 from digital_humain.utils.config import load_config
 from digital_humain.memory.demonstration import DemonstrationMemory
-from digital_humain.memory.episodic import EpisodicMemory, MemorySummarizer
+# Vision, GUI automation, tools and episodic memory are imported where first used
+
+# Provider model lists cached in memory and on disk, keyed by provider/base URL/API key
+MODEL_CACHE_FILE = Path.home() / ".cache" / "digital_humain" / "models.json"
+MODEL_CACHE_TTL = 3600.0
+
+
+def _make_http_client() -> httpx.Client:
+    """Build the pooled client, using HTTP/2 when the optional h2 package is installed."""
+    kwargs = dict(
+        timeout=20,
+        limits=httpx.Limits(max_keepalive_connections=4, keepalive_expiry=30.0),
+    )
+    try:
+        return httpx.Client(http2=True, **kwargs)
+    except ImportError:  # httpx[http2] not installed
+        return httpx.Client(**kwargs)
+
+
+# Pooled HTTP client shared by model-list fetches so refreshes reuse the TLS connection
+_HTTP_CLIENT = _make_http_client()
+atexit.register(_HTTP_CLIENT.close)
+
+# How often queued log lines are flushed into the log widget (~30 FPS)
+LOG_FLUSH_INTERVAL_MS = 33
+# Log widget keeps at most LOG_MAX_LINES; overflow is trimmed LOG_TRIM_LINES at a time
+LOG_MAX_LINES = 5000
+LOG_TRIM_LINES = 500
+
+# Quiet period after the last filter keystroke before the model list is re-filtered
+FILTER_DEBOUNCE_MS = 150
+# Ollama listing gives up after 0.5 s without a connection, so machines without Ollama fall back fast
+OLLAMA_CONNECT_TIMEOUT = httpx.Timeout(5.0, connect=0.5)
+# A successful Ollama reachability probe is trusted this long before Run Task re-checks
+OLLAMA_PROBE_TTL = 30.0
+# Voice input gives up if no speech starts within this many seconds
+VOICE_LISTEN_TIMEOUT_S = 8
 
 class TextHandler:
+    """Loguru sink that queues messages and flushes them into the widget on the Tk thread."""
+
     def __init__(self, text_widget):
         self.text_widget = text_widget
+        self._q = queue.SimpleQueue()
+        self.text_widget.after(LOG_FLUSH_INTERVAL_MS, self._flush)
 
     def write(self, message):
-        self.text_widget.configure(state='normal')
-        self.text_widget.insert(tk.END, message)
-        self.text_widget.see(tk.END)
-        self.text_widget.configure(state='disabled')
+        self._q.put(message)  # thread-safe; no Tk calls off the main thread
+
+    def _flush(self):
+        parts = []
+        while True:
+            try:
+                parts.append(self._q.get_nowait())
+            except queue.Empty:
+                break
+        if parts:
+            self.text_widget.configure(state='normal')
+            self.text_widget.insert(tk.END, "".join(parts))
+            lines = int(self.text_widget.index('end-1c').split('.')[0])
+            if lines > LOG_MAX_LINES:
+                self.text_widget.delete('1.0', f'{lines - LOG_MAX_LINES + LOG_TRIM_LINES}.0')
+            self.text_widget.see(tk.END)
+            self.text_widget.configure(state='disabled')
+        self.text_widget.after(LOG_FLUSH_INTERVAL_MS, self._flush)
 
 class DigitalHumainGUI:
     def __init__(self, root):
@@ -50,20 +105,57 @@ class DigitalHumainGUI:
         self.root.geometry("1200x850")
         self._init_style()
         self.current_models = []
+        self._models_lower: List[str] = []  # current_models lowercased once per load
+        self._free_models: List[str] = []  # subset of current_models with "free" in the name
+        self._free_models_lower: List[str] = []
         self.cancel_event = None
-        self.agent_thread = None
+        self.agent_future = None  # run_agent coroutine scheduled on _agent_loop
+        # Built on the first run and reused by later runs
+        self._screen_analyzer = None
+        self._gui_actions = None
+        self._tool_registry = None
+        # Tasks run as coroutines on this loop so Stop can cancel them at the next await
+        self._agent_loop = asyncio.new_event_loop()
+        # Graph nodes and setup run one at a time on this worker; a node abandoned by Stop
+        # keeps it busy until it returns, which is when the controls are re-enabled
+        self._agent_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="gui-agent-step")
+        self._agent_loop.set_default_executor(self._agent_executor)
+        threading.Thread(target=self._agent_loop.run_forever, name="gui-agent", daemon=True).start()
         self.provider_health_status = "unknown"  # unknown, healthy, unhealthy
         self.provider_health_message = ""
+        self._model_cache: Dict[str, list] = self._read_model_cache_file()  # key -> [expires_at, models]
+        self._force_refresh = False  # set by Shift+click on Refresh Models
+        self._model_cache_lock = threading.Lock()
+        self._config = None  # parsed config/config.yaml, loaded on first use
+        self._config_lock = threading.Lock()
+        # Network I/O (model listing, health checks) runs here, never on the Tk thread
+        self._io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="gui-io")
+        # Voice capture waits on the microphone, so it gets its own worker and never holds up model loads
+        self._voice_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="gui-voice")
+        self._load_gen = 0  # bumped per model-list load; stale results are dropped
+        self._load_future = None  # most recent model-list fetch
+        self._filter_after_id = None  # pending debounced apply_filter
+        self._last_filtered: Optional[List[str]] = None  # values last pushed into model_combo
+        self._ollama_probe = (0.0, False)  # (monotonic time, reachable) of the last Ollama probe
+        self._ollama_provider: Optional[OllamaProvider] = None  # keeps its pooled client across loads
+        self._run_llm = None  # provider of the latest run, closed when the next run replaces it
         
         # Initialize memory systems
-        self.demo_memory = DemonstrationMemory()
-        self.episodic_memory = EpisodicMemory()
-        self.memory_summarizer = MemorySummarizer()
+        self.demo_memory = DemonstrationMemory()  # lists demos while building the UI
         
         self.setup_ui()
-        self._detect_initial_provider()
         self.load_models()
 
+    @cached_property
+    def episodic_memory(self):
+        from digital_humain.memory.episodic import EpisodicMemory
+        return EpisodicMemory()
+
+    @cached_property
+    def memory_summarizer(self):
+        from digital_humain.memory.episodic import MemorySummarizer
+        return MemorySummarizer()
+
     def _init_style(self):
         # Modern, high-contrast professional palette
         bg = "#1e1e2e"           # Darker slate background
@@ -79,77 +171,87 @@ class DigitalHumainGUI:
         style = ttk.Style()
         style.theme_use("clam")
 
-        # Frames
-        style.configure("TFrame", background=bg)
-        
-        # LabelFrames (sections)
-        style.configure("TLabelframe", 
-                       background=panel, 
-                       foreground=text, 
-                       bordercolor=border,
-                       borderwidth=2,
-                       relief="solid")
-        style.configure("TLabelframe.Label", 
-                       background=panel, 
-                       foreground=accent,
-                       font=("Segoe UI", 10, "bold"),
-                       padding=6)
-        
-        # Labels
-        style.configure("TLabel", 
-                       background=panel, 
-                       foreground=text,
-                       font=("Segoe UI", 9))
-        
-        # Buttons
-        style.configure("TButton", 
-                       background=accent, 
-                       foreground="#000000",
-                       borderwidth=0,
-                       focusthickness=0,
-                       font=("Segoe UI", 9, "bold"),
-                       padding=8)
-        style.map("TButton", 
-                 background=[("active", accent_hover), ("pressed", "#008fb3")],
-                 foreground=[("active", "#000000")])
-        
-        # Combobox
-        style.configure("TCombobox", 
-                       fieldbackground=input_bg,
-                       background=input_bg,
-                       foreground=text,
-                       arrowcolor=accent,
-                       borderwidth=1,
-                       relief="solid")
-        style.map("TCombobox",
-                 fieldbackground=[("readonly", input_bg)],
-                 selectbackground=[("readonly", accent)],
-                 selectforeground=[("readonly", "#000000")])
-        
-        # Entry
-        style.configure("TEntry", 
-                       fieldbackground=input_bg,
-                       foreground=text,
-                       bordercolor=border,
-                       borderwidth=1,
-                       relief="solid",
-                       insertcolor=accent)
-        
-        # Checkbutton
-        style.configure("TCheckbutton",
-                       background=panel,
-                       foreground=text,
-                       font=("Segoe UI", 9))
-        
-        # Scrollbar
-        style.configure("Vertical.TScrollbar", 
-                       gripcount=0,
-                       background=panel,
-                       darkcolor=panel,
-                       lightcolor=panel,
-                       troughcolor=bg,
-                       bordercolor=border,
-                       arrowcolor=accent)
+        # All widget styles go to Tcl in one theme_settings call
+        style.theme_settings("clam", {
+            # Frames
+            "TFrame": {"configure": {"background": bg}},
+            # LabelFrames (sections)
+            "TLabelframe": {"configure": {
+                "background": panel,
+                "foreground": text,
+                "bordercolor": border,
+                "borderwidth": 2,
+                "relief": "solid",
+            }},
+            "TLabelframe.Label": {"configure": {
+                "background": panel,
+                "foreground": accent,
+                "font": ("Segoe UI", 10, "bold"),
+                "padding": 6,
+            }},
+            # Labels
+            "TLabel": {"configure": {
+                "background": panel,
+                "foreground": text,
+                "font": ("Segoe UI", 9),
+            }},
+            # Buttons
+            "TButton": {
+                "configure": {
+                    "background": accent,
+                    "foreground": "#000000",
+                    "borderwidth": 0,
+                    "focusthickness": 0,
+                    "font": ("Segoe UI", 9, "bold"),
+                    "padding": 8,
+                },
+                "map": {
+                    "background": [("active", accent_hover), ("pressed", "#008fb3")],
+                    "foreground": [("active", "#000000")],
+                },
+            },
+            # Combobox
+            "TCombobox": {
+                "configure": {
+                    "fieldbackground": input_bg,
+                    "background": input_bg,
+                    "foreground": text,
+                    "arrowcolor": accent,
+                    "borderwidth": 1,
+                    "relief": "solid",
+                },
+                "map": {
+                    "fieldbackground": [("readonly", input_bg)],
+                    "selectbackground": [("readonly", accent)],
+                    "selectforeground": [("readonly", "#000000")],
+                },
+            },
+            # Entry
+            "TEntry": {"configure": {
+                "fieldbackground": input_bg,
+                "foreground": text,
+                "bordercolor": border,
+                "borderwidth": 1,
+                "relief": "solid",
+                "insertcolor": accent,
+            }},
+            # Checkbutton
+            "TCheckbutton": {"configure": {
+                "background": panel,
+                "foreground": text,
+                "font": ("Segoe UI", 9),
+            }},
+            # Scrollbar
+            "Vertical.TScrollbar": {"configure": {
+                "gripcount": 0,
+                "background": panel,
+                "darkcolor": panel,
+                "lightcolor": panel,
+                "troughcolor": bg,
+                "bordercolor": border,
+                "arrowcolor": accent,
+            }},
+        })
 
         self.colors = {
             "bg": bg,
@@ -186,8 +288,21 @@ class DigitalHumainGUI:
         self.health_canvas.pack(side=tk.LEFT, padx=(0, 5))
         self.health_dot = self.health_canvas.create_oval(2, 2, 10, 10, fill="#666666", outline="")
         
-        # Tooltip support
-        self.health_tooltip = None
+        # Tooltip support: one hidden window, shown and withdrawn on hover
+        self.health_tooltip = tk.Toplevel(self.root)
+        self.health_tooltip.wm_overrideredirect(True)
+        self.health_tooltip.withdraw()
+        self._tooltip_label = tk.Label(
+            self.health_tooltip,
+            text="Status unknown",
+            background="#282a36",
+            foreground="#f8f8f2",
+            relief="solid",
+            borderwidth=1,
+            padx=5,
+            pady=3
+        )
+        self._tooltip_label.pack()
         self.health_canvas.bind("<Enter>", self._show_health_tooltip)
         self.health_canvas.bind("<Leave>", self._hide_health_tooltip)
         
@@ -204,7 +319,11 @@ class DigitalHumainGUI:
         self.model_combo = ttk.Combobox(model_frame, textvariable=self.model_var, state="readonly")
         self.model_combo.grid(row=0, column=3, padx=5, pady=2, sticky="ew")
 
-        ttk.Button(model_frame, text="Refresh Models", command=self.load_models).grid(row=0, column=4, padx=5, pady=2)
+        # Shift+click bypasses the model list cache and re-reads the config
+        refresh_btn = ttk.Button(model_frame, text="Refresh Models",
+                                 command=lambda: self.load_models(force=self._force_refresh))
+        refresh_btn.grid(row=0, column=4, padx=5, pady=2)
+        refresh_btn.bind("<Button-1>", self._note_refresh_modifiers, add="+")
 
         ttk.Label(model_frame, text="API Key (OpenRouter/Letta):").grid(row=1, column=0, padx=5, pady=2, sticky="w")
         self.api_key_var = tk.StringVar(value=os.environ.get("OPENROUTER_API_KEY", ""))
@@ -216,7 +335,7 @@ class DigitalHumainGUI:
         self.filter_var = tk.StringVar()
         self.filter_entry = ttk.Entry(model_frame, textvariable=self.filter_var)
         self.filter_entry.grid(row=2, column=1, padx=5, pady=2, sticky="ew")
-        self.filter_entry.bind("<KeyRelease>", lambda _e: self.apply_filter())
+        self.filter_entry.bind("<KeyRelease>", lambda _e: self._schedule_filter())
 
         self.free_only = tk.BooleanVar(value=False)
         ttk.Checkbutton(model_frame, text="Free only", variable=self.free_only, command=self.apply_filter).grid(row=2, column=2, padx=5, pady=2, sticky="w")
@@ -249,7 +368,8 @@ class DigitalHumainGUI:
         self.stop_btn = ttk.Button(control_frame, text="Stop", command=self.stop_task, state="disabled")
         self.stop_btn.pack(side=tk.LEFT, padx=5)
 
-        ttk.Button(control_frame, text="Voice Input", command=self.voice_to_text).pack(side=tk.LEFT, padx=5)
+        self.voice_btn = ttk.Button(control_frame, text="Voice Input", command=self.voice_to_text)
+        self.voice_btn.pack(side=tk.LEFT, padx=5)
         ttk.Button(control_frame, text="Clear Logs", command=self.clear_logs).pack(side=tk.LEFT, padx=5)
         
         # Recording & Memory Controls
@@ -331,42 +451,128 @@ class DigitalHumainGUI:
         logger.remove()
         logger.add(TextHandler(self.log_area), format="{time:HH:mm:ss} | {level} | {message}")
 
-    def load_models(self):
+    def _note_refresh_modifiers(self, event):
+        self._force_refresh = bool(event.state & 0x0001)  # Shift held
+
+    def _read_model_cache_file(self) -> Dict[str, list]:
+        try:
+            return json.loads(MODEL_CACHE_FILE.read_text())
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def _model_cache_key(provider: str, base_url: str, api_key: str = "") -> str:
+        return hashlib.sha256(f"{provider}|{base_url}|{api_key}".encode()).hexdigest()
+
+    def _cached_models(self, key: str) -> Optional[List[str]]:
+        """Return a cached model list that has not expired yet."""
+        with self._model_cache_lock:
+            entry = self._model_cache.get(key)
+        if entry and time.time() < entry[0]:
+            return entry[1]
+        return None
+
+    def _store_models(self, key: str, models: List[str]):
+        with self._model_cache_lock:
+            self._model_cache[key] = [time.time() + MODEL_CACHE_TTL, models]
+            tmp_file = MODEL_CACHE_FILE.with_suffix(".json.tmp")
+            try:
+                MODEL_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+                tmp_file.write_text(json.dumps(self._model_cache))
+                os.replace(tmp_file, MODEL_CACHE_FILE)
+            except OSError as e:
+                logger.debug(f"Could not write model cache: {e}")
+
+    def get_config(self) -> dict:
+        """Return the parsed config, reading it from disk only on first use."""
+        with self._config_lock:
+            if self._config is None:
+                self._config = load_config()
+            return self._config
+
+    def load_models(self, force: bool = False):
+        """Load the selected provider's models in the background; force skips the model list cache."""
+        if force:
+            with self._config_lock:
+                self._config = None  # a forced refresh also re-reads the config
+        self._force_refresh = False
+        self._load_gen += 1
+        gen = self._load_gen
         provider = self.provider_var.get()
+        api_key = self.api_key_var.get().strip()
+        if self._load_future is not None:
+            self._load_future.cancel()  # drops a superseded fetch that has not started yet
+        future = self._io_pool.submit(self._fetch_models, gen, provider, api_key, force)
+        future.add_done_callback(lambda fut: self.root.after(0, self._apply_models, gen, fut))
+        self._load_future = future
+
+    def _fetch_models(self, gen: int, provider: str, api_key: str, force: bool = False) -> Optional[tuple]:
+        """Return (provider, models, health status, health message); runs on the I/O pool."""
+        if gen != self._load_gen:
+            return None  # superseded while queued; skip the HTTP call
         if provider == "ollama":
-            self._load_ollama_models()
+            return self._fetch_ollama_models(api_key, force)
         elif provider == "openrouter":
-            self._load_openrouter_models()
+            return self._fetch_openrouter_models(api_key, force)
         elif provider == "letta":
-            self._load_letta_models()
+            return self._fetch_letta_models(api_key)
+        return None
+
+    def _apply_models(self, gen: int, future):
+        """Show a fetched model list on the Tk thread unless a newer load superseded it."""
+        if gen != self._load_gen:
+            return
+        try:
+            result = future.result()
+        except Exception as e:
+            logger.error(f"Model list load failed: {e}")
+            return
+        if result is None:
+            return
+        provider, models, status, message = result
+        if self.provider_var.get() != provider:
+            self.provider_var.set(provider)
+        self._set_models(models)
+        self.apply_filter()
+        self._update_health_indicator(status, message)
 
-    def _load_ollama_models(self):
+    def _fetch_ollama_models(self, api_key: str, force: bool = False) -> tuple:
         """Load models from a local Ollama server if available; otherwise fall back."""
         try:
             # Use our HTTP-based provider (no python 'ollama' dependency)
-            provider = OllamaProvider()
-            models_meta = provider.list_models()
-            model_names = []
-            for m in models_meta:
-                # Accept common keys from Ollama /api/tags
-                name = m.get("name") or m.get("model") or m.get("id")
-                if name:
-                    model_names.append(name)
-            if not model_names:
-                raise RuntimeError("No models found or Ollama not reachable")
-            self.current_models = model_names
-            self.apply_filter()
-            self._update_health_indicator("healthy", "Ollama: Connected")
+            if self._ollama_provider is None:
+                self._ollama_provider = OllamaProvider()
+            provider = self._ollama_provider
+            cache_key = self._model_cache_key("ollama", provider.base_url)
+            model_names = None if force else self._cached_models(cache_key)
+            if model_names is None:
+                models_meta = provider.list_models(timeout=OLLAMA_CONNECT_TIMEOUT)
+                model_names = []
+                for m in models_meta:
+                    # Accept common keys from Ollama /api/tags
+                    name = m.get("name") or m.get("model") or m.get("id")
+                    if name:
+                        model_names.append(name)
+                if not model_names:
+                    raise RuntimeError("No models found or Ollama not reachable")
+                self._store_models(cache_key, model_names)
+                return "ollama", model_names, "healthy", "Ollama: Connected"
+            # Cached list: still confirm the server answers (its root is a tiny "Ollama is running")
+            _HTTP_CLIENT.get(provider.base_url, timeout=OLLAMA_CONNECT_TIMEOUT).raise_for_status()
+            return "ollama", model_names, "healthy", "Ollama: Connected (cached)"
         except Exception as e:
             logger.warning(f"Ollama unavailable: {e}. Switching to OpenRouter fallback.")
-            self._update_health_indicator("unhealthy", f"Ollama: {str(e)[:50]}")
-            self.provider_var.set("openrouter")
-            self._load_openrouter_models()
+            return self._fetch_openrouter_models(api_key, force)
 
-    def _load_openrouter_models(self):
-        config = load_config()
+    def _fetch_openrouter_models(self, api_key: str, force: bool = False) -> tuple:
+        config = self.get_config()
         base_url = config.get("llm", {}).get("openrouter", {}).get("base_url", "https://openrouter.ai/api/v1")
-        api_key = self.api_key_var.get().strip() or os.environ.get("OPENROUTER_API_KEY", "")
+        api_key = api_key or os.environ.get("OPENROUTER_API_KEY", "")
+        cache_key = self._model_cache_key("openrouter", base_url, api_key)
+        if not force:
+            cached = self._cached_models(cache_key)
+            if cached:
+                return "openrouter", cached, "healthy", "OpenRouter: Connected (cached)"
 
         fallback_models: List[str] = [
             "openrouter/nvidia/nemotron-nano-12b-v2-vl:free",
@@ -381,88 +587,75 @@ class DigitalHumainGUI:
             if api_key:
                 headers["Authorization"] = f"Bearer {api_key}"
 
-            with httpx.Client(timeout=20) as client:
-                resp = client.get(url, headers=headers)
-                resp.raise_for_status()
-                data = resp.json().get("data", [])
-                models = [item.get("id") for item in data if item.get("id")]
-                if models:
-                    self.current_models = models
-                    self.apply_filter()
-                    self._update_health_indicator("healthy", "OpenRouter: Connected")
-                    return
+            resp = _HTTP_CLIENT.get(url, headers=headers)
+            resp.raise_for_status()
+            payload = orjson.loads(resp.content) if orjson is not None else resp.json()
+            data = payload.get("data", [])
+            models = [item.get("id") for item in data if item.get("id")]
+            if models:
+                self._store_models(cache_key, models)
+                return "openrouter", models, "healthy", "OpenRouter: Connected"
         except Exception as e:
             logger.warning(f"OpenRouter model fetch failed, using fallback list: {e}")
-            self._update_health_indicator("unhealthy" if not api_key else "healthy", 
-                                         "OpenRouter: No API key" if not api_key else "OpenRouter: Using fallback")
 
-        self.current_models = fallback_models
-        self.apply_filter()
+        return ("openrouter", fallback_models, "unhealthy" if not api_key else "healthy",
+                "OpenRouter: No API key" if not api_key else "OpenRouter: Using fallback")
 
-    def _load_letta_models(self):
+    def _fetch_letta_models(self, api_key: str) -> tuple:
         # Letta uses server-side model selection; we surface a safe default list (free-first)
-        cfg = load_config()
+        cfg = self.get_config()
         default_model = cfg.get("llm", {}).get("letta", {}).get("default_model", "openrouter/nvidia/nemotron-nano-12b-v2-vl:free")
-        self.current_models = [
+        models = [
             "openrouter/nvidia/nemotron-nano-12b-v2-vl:free",
             "openrouter/amazon/nova-2-lite-v1:free",
             "openrouter/qwen/qwen-2-7b-instruct",
             "openrouter/deepseek/deepseek-chat",
         ]
         # Put configured default first if present
-        if default_model in self.current_models:
-            self.current_models.remove(default_model)
-            self.current_models.insert(0, default_model)
-        self.apply_filter()
+        if default_model in models:
+            models.remove(default_model)
+            models.insert(0, default_model)
         
         # Check if API key is set
-        api_key = self.api_key_var.get().strip() or os.environ.get("LETTA_API_KEY", "")
+        api_key = api_key or os.environ.get("LETTA_API_KEY", "")
         if api_key:
-            self._update_health_indicator("healthy", "Letta: API key configured")
-        else:
-            self._update_health_indicator("unhealthy", "Letta: No API key")
+            return "letta", models, "healthy", "Letta: API key configured"
+        return "letta", models, "unhealthy", "Letta: No API key"
+
+    def _set_models(self, models: List[str]):
+        self.current_models = models
+        self._models_lower = [m.lower() for m in models]
+        free = [(m, m_low) for m, m_low in zip(models, self._models_lower) if "free" in m_low]
+        self._free_models = [m for m, _ in free]
+        self._free_models_lower = [m_low for _, m_low in free]
+
+    def _schedule_filter(self):
+        """Re-filter once typing pauses for FILTER_DEBOUNCE_MS."""
+        if self._filter_after_id is not None:
+            self.root.after_cancel(self._filter_after_id)
+        self._filter_after_id = self.root.after(FILTER_DEBOUNCE_MS, self.apply_filter)
 
     def apply_filter(self):
-        models = getattr(self, "current_models", [])
+        if self._filter_after_id is not None:
+            self.root.after_cancel(self._filter_after_id)
+            self._filter_after_id = None
+        models = self.current_models
         query = self.filter_var.get().lower()
-        free_only = self.free_only.get()
-
-        def match(m: str) -> bool:
-            if free_only and "free" not in m.lower():
-                return False
-            if query and query not in m.lower():
-                return False
-            return True
+        if self.free_only.get():
+            candidates = zip(self._free_models, self._free_models_lower)
+        else:
+            candidates = zip(models, self._models_lower)
 
-        filtered = [m for m in models if match(m)]
+        filtered = [m for m, m_low in candidates if not query or query in m_low]
         if not filtered and models:
             filtered = models  # fallback to full list if filter empty
+        if filtered == self._last_filtered:
+            return  # combobox already shows this list; keep the current selection
+        self._last_filtered = filtered
         self.model_combo['values'] = filtered
         if filtered:
             self.model_combo.set(filtered[0])
 
-    def _detect_initial_provider(self):
-        """Detect which provider is available on startup and set as default."""
-        try:
-            # Try Ollama first
-            provider = OllamaProvider()
-            models = provider.list_models()
-            if models:
-                logger.info("Ollama detected and set as default provider")
-                self.provider_var.set("ollama")
-                return
-        except Exception as e:
-            logger.debug(f"Ollama not available: {e}")
-        
-        # Fall back to OpenRouter if API key is present
-        api_key = os.environ.get("OPENROUTER_API_KEY", "")
-        if api_key:
-            logger.info("OpenRouter API key found - setting as default provider")
-            self.provider_var.set("openrouter")
-        else:
-            logger.warning("No providers available. Please install Ollama or set OPENROUTER_API_KEY")
-            # Keep ollama as default, will show error when loading models
-
     def _update_health_indicator(self, status: str, message: str):
         """Update the health indicator dot color and tooltip."""
         self.provider_health_status = status
@@ -485,27 +678,13 @@ class DigitalHumainGUI:
         x += self.health_canvas.winfo_rootx() + 15
         y += self.health_canvas.winfo_rooty() + 15
         
-        self.health_tooltip = tk.Toplevel(self.root)
-        self.health_tooltip.wm_overrideredirect(True)
+        self._tooltip_label.configure(text=self.provider_health_message or "Status unknown")
         self.health_tooltip.wm_geometry(f"+{x}+{y}")
-        
-        label = tk.Label(
-            self.health_tooltip,
-            text=self.provider_health_message or "Status unknown",
-            background="#282a36",
-            foreground="#f8f8f2",
-            relief="solid",
-            borderwidth=1,
-            padx=5,
-            pady=3
-        )
-        label.pack()
+        self.health_tooltip.deiconify()
 
     def _hide_health_tooltip(self, event):
         """Hide the tooltip."""
-        if self.health_tooltip:
-            self.health_tooltip.destroy()
-            self.health_tooltip = None
+        self.health_tooltip.withdraw()
 
     def clear_logs(self):
         self.log_area.configure(state='normal')
@@ -525,77 +704,115 @@ class DigitalHumainGUI:
             logger.warning("Please select a model")
             return
             
-        # Prepare cancellation flag and thread
+        # Prepare cancellation flag and schedule the run on the agent loop
         self.cancel_event = threading.Event()
         self.run_btn.configure(state='disabled')
         self.stop_btn.configure(state='normal')
-        self.agent_thread = threading.Thread(target=self.run_agent, args=(task, model, provider, self.cancel_event), daemon=True)
-        self.agent_thread.start()
+        self.agent_future = asyncio.run_coroutine_threadsafe(
+            self.run_agent(task, model, provider, self.cancel_event, self.overlay_enabled.get()),
+            self._agent_loop
+        )
 
     def stop_task(self):
         if self.cancel_event and not self.cancel_event.is_set():
             self.cancel_event.set()
+            if self.agent_future is not None:
+                self.agent_future.cancel()  # interrupts the run at its next await
             logger.warning("Stop requested; attempting to halt current task")
         else:
             logger.info("No active task to stop")
 
-    def run_agent(self, task, model, provider, cancel_event):
-        try:
-            logger.info(f"Starting task with provider={provider}, model={model}")
-            
-            # Initialize components
-            config = load_config()
-            llm = self._build_llm(provider, model, config)
-            
-            screen_analyzer = ScreenAnalyzer(
+    def _prepare_engine(self, task, model, provider, cancel_event, show_overlay=True):
+        """Build the LLM, tools and agent graph for one run; runs in a worker thread."""
+        from digital_humain.core.engine import AgentEngine
+        from digital_humain.vlm.screen_analyzer import ScreenAnalyzer
+        from digital_humain.vlm.actions import GUIActions
+        from digital_humain.tools.base import ToolRegistry
+        from digital_humain.tools.file_tools import FileReadTool, FileWriteTool
+        from digital_humain.agents.automation_agent import DesktopAutomationAgent
+
+        logger.info(f"Starting task with provider={provider}, model={model}")
+        
+        # Initialize components
+        config = self.get_config()
+        llm = self._build_llm(provider, model, config)
+        # The previous run has returned by now, so its provider's client can go
+        if self._run_llm is not None:
+            self._run_llm.close()
+        self._run_llm = llm
+        
+        if self._screen_analyzer is None:
+            self._screen_analyzer = ScreenAnalyzer(
                 save_screenshots=True,
                 screenshot_dir="./screenshots"
             )
-            
-            gui_actions = GUIActions(pause=1.0, show_overlay=self.overlay_enabled.get())  # Slower for safety
-            
-            tool_registry = ToolRegistry()
-            tool_registry.register(FileReadTool())
-            tool_registry.register(FileWriteTool())
-            
-            agent_config = AgentConfig(
-                name="gui_agent",
-                role=AgentRole.EXECUTOR,
-                model=model,
-                max_iterations=15
-            )
-            
-            agent = DesktopAutomationAgent(
-                config=agent_config,
-                llm_provider=llm,
-                screen_analyzer=screen_analyzer,
-                gui_actions=gui_actions,
-                tool_registry=tool_registry
+        
+        if self._gui_actions is None:
+            self._gui_actions = GUIActions(pause=1.0, show_overlay=show_overlay)  # Slower for safety
+        else:
+            self._gui_actions.clear_history()  # action history stays per run
+            self._gui_actions.set_overlay(show_overlay)
+        
+        if self._tool_registry is None:
+            self._tool_registry = ToolRegistry()
+            self._tool_registry.register(FileReadTool())
+            self._tool_registry.register(FileWriteTool())
+        
+        agent_config = AgentConfig(
+            name="gui_agent",
+            role=AgentRole.EXECUTOR,
+            model=model,
+            max_iterations=15
+        )
+        
+        agent = DesktopAutomationAgent(
+            config=agent_config,
+            llm_provider=llm,
+            screen_analyzer=self._screen_analyzer,
+            gui_actions=self._gui_actions,
+            tool_registry=self._tool_registry
+        )
+        
+        engine = AgentEngine(agent, cancel_event=cancel_event)
+        engine.build_graph()
+        
+        # Retrieve relevant past episodes if enabled
+        if self.episodic_memory.enable_recall:
+            relevant_episodes = self.episodic_memory.retrieve_relevant(task, top_k=3)
+            if relevant_episodes:
+                logger.info(f"Retrieved {len(relevant_episodes)} relevant past episodes")
+                for ep in relevant_episodes:
+                    logger.debug(f"  - Episode {ep.id}: {ep.observation[:50]}...")
+        
+        return engine
+
+    def _store_episodes(self, result, task, model, provider):
+        """Save a finished run's steps to episodic memory; runs in a worker thread."""
+        if self.episodic_memory.enable_recall and result.get('history'):
+            # One metadata dict shared by every episode; Episode copies it on validation
+            metadata = {'task': task, 'model': model, 'provider': provider}
+            episodes = []
+            for step in result['history']:
+                action = step.get('action', {})
+                episodes.append({
+                    'observation': step.get('observation', ''),
+                    'reasoning': step.get('reasoning', ''),
+                    'action': action,
+                    'result': str(action.get('success', False)),
+                    'metadata': metadata
+                })
+            self.episodic_memory.add_episodes_bulk(episodes)
+
+    async def run_agent(self, task, model, provider, cancel_event, show_overlay=True):
+        try:
+            # Setup and memory bookkeeping block on I/O, so they run in worker threads
+            engine = await asyncio.to_thread(
+                self._prepare_engine, task, model, provider, cancel_event, show_overlay
             )
-            
-            engine = AgentEngine(agent, cancel_event=cancel_event)
-            engine.build_graph()
-            
-            # Retrieve relevant past episodes if enabled
-            if self.episodic_memory.enable_recall:
-                relevant_episodes = self.episodic_memory.retrieve_relevant(task, top_k=3)
-                if relevant_episodes:
-                    logger.info(f"Retrieved {len(relevant_episodes)} relevant past episodes")
-                    for ep in relevant_episodes:
-                        logger.debug(f"  - Episode {ep.id}: {ep.observation[:50]}...")
-            
-            result = engine.run(task, recursion_limit=15)
+            result = await engine.run_async(task, recursion_limit=15)
             
             # Store episode in episodic memory if enabled
-            if self.episodic_memory.enable_recall and result.get('history'):
-                for step in result['history']:
-                    self.episodic_memory.add_episode(
-                        observation=step.get('observation', ''),
-                        reasoning=step.get('reasoning', ''),
-                        action=step.get('action', {}),
-                        result=str(step.get('action', {}).get('success', False)),
-                        metadata={'task': task, 'model': model, 'provider': provider}
-                    )
+            await asyncio.to_thread(self._store_episodes, result, task, model, provider)
             
             if result['error']:
                 logger.error(f"Task failed: {result['error']}")
@@ -607,16 +824,22 @@ class DigitalHumainGUI:
                     stats = self.episodic_memory.get_stats()
                     logger.info(f"Episodic memory: {stats['total_episodes']} episodes stored")
                 
+        except asyncio.CancelledError:
+            logger.warning("Task cancelled; waiting for the current step to finish")
+            raise
         except Exception as e:
             logger.error(f"Execution error: {e}")
         finally:
-            self.root.after(0, self._reset_controls)
+            # Queued behind any in-flight step, so Run stays disabled until that step returns
+            self._agent_executor.submit(lambda: None).add_done_callback(
+                lambda _: self.root.after(0, self._reset_controls)
+            )
 
     def _reset_controls(self):
         self.run_btn.configure(state='normal')
         self.stop_btn.configure(state='disabled')
         self.cancel_event = None
-        self.agent_thread = None
+        self.agent_future = None
 
     def _build_llm(self, provider: str, model: str, config: dict):
         if provider == "openrouter":
@@ -647,24 +870,31 @@ class DigitalHumainGUI:
             )
 
         # Ollama (default local). If not reachable, try OpenRouter fallback.
+        ol = None
         try:
             ol = OllamaProvider(
                 model=model,
                 base_url=config.get("llm", {}).get("base_url", "http://localhost:11434"),
                 timeout=config.get("llm", {}).get("timeout", 300)
             )
-            # Health check: list models
-            if not ol.list_models():
-                raise RuntimeError("Ollama not reachable or no models available")
+            # Health check: list models, unless a recent probe already succeeded
+            probed_at, ok = self._ollama_probe
+            if not ok or time.monotonic() - probed_at > OLLAMA_PROBE_TTL:
+                ok = bool(ol.list_models(timeout=OLLAMA_CONNECT_TIMEOUT))
+                self._ollama_probe = (time.monotonic(), ok)
+                if not ok:
+                    raise RuntimeError("Ollama not reachable or no models available")
             return ol
         except Exception as e:
             logger.warning(f"Ollama not available: {e}")
+            if ol is not None:
+                ol.close()
             # Attempt OpenRouter fallback if API key is present
             or_cfg = config.get("llm", {}).get("openrouter", {})
             api_key = self.api_key_var.get().strip() or os.environ.get("OPENROUTER_API_KEY", "")
             if api_key:
                 logger.info("Falling back to OpenRouter provider")
-                self.provider_var.set("openrouter")
+                self.root.after(0, self.provider_var.set, "openrouter")
                 return OpenRouterProvider(
                     model=model or or_cfg.get("default_model", "openrouter/nvidia/nemotron-nano-12b-v2-vl:free"),
                     api_key=api_key,
@@ -688,21 +918,44 @@ class DigitalHumainGUI:
         logger.success("OPENROUTER_API_KEY set for this session")
 
     def voice_to_text(self):
+        """Capture one spoken phrase on the voice worker and put the transcript in the task box."""
+        try:
+            import speech_recognition as sr
+        except ImportError:  # Voice input stays optional
+            sr = None
         if sr is None:
             logger.error("speech_recognition not installed. Run: pip install SpeechRecognition pyaudio")
             return
+        self.voice_btn.configure(state="disabled", text="Listening...")
+        future = self._voice_executor.submit(self._recognize_speech, sr)
+        future.add_done_callback(lambda fut: self.root.after(0, self._apply_voice_text, fut))
+
+    def _recognize_speech(self, sr) -> str:
+        """Record and transcribe a phrase from the microphone; runs on the voice worker."""
+        recognizer = sr.Recognizer()
+        with sr.Microphone() as source:
+            logger.info("Listening... (speak now)")
+            try:
+                audio = recognizer.listen(
+                    source, timeout=VOICE_LISTEN_TIMEOUT_S, phrase_time_limit=10
+                )
+            except sr.WaitTimeoutError:
+                logger.warning(f"No speech heard within {VOICE_LISTEN_TIMEOUT_S} s")
+                return ""
+        return recognizer.recognize_google(audio, language="en-US")
+
+    def _apply_voice_text(self, future):
+        """Re-enable the voice button and show the transcript on the Tk thread."""
+        self.voice_btn.configure(state="normal", text="Voice Input")
         try:
-            recognizer = sr.Recognizer()
-            with sr.Microphone() as source:
-                logger.info("Listening... (speak now)")
-                audio = recognizer.listen(source, phrase_time_limit=10)
-            text = recognizer.recognize_google(audio, language="en-US")
-            if text:
-                self.task_text.delete("1.0", tk.END)
-                self.task_text.insert("1.0", text)
-                logger.info(f"Voice captured: {text}")
+            text = future.result()
         except Exception as e:
             logger.error(f"Voice capture failed: {e}")
+            return
+        if text:
+            self.task_text.delete("1.0", tk.END)
+            self.task_text.insert("1.0", text)
+            logger.info(f"Voice captured: {text}")
     
     def toggle_recording(self):
         """Toggle recording on/off."""
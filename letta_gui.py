@@ -5,28 +5,143 @@ Implements Letta-like core memory, archival memory, and advanced conversation ma
 
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox
+import asyncio
+import atexit
 import threading
+import queue
 import sys
 import os
 import json
+import time
+import importlib
+import functools
+import hashlib
+import re
 from pathlib import Path
-from typing import List, Dict, Optional
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from collections import defaultdict, deque
+from typing import List, Dict, Optional, Set
 from datetime import datetime
 import httpx
 from loguru import logger
 from dotenv import load_dotenv
 
-# Optional token counting
-try:
-    import tiktoken
-except ImportError:
-    tiktoken = None
+# Optional modules (tiktoken, speech_recognition) are imported on first use
+_LAZY_MODULES: Dict[str, object] = {}
 
-# Optional voice input
-try:
-    import speech_recognition as sr
-except ImportError:
-    sr = None
+
+def _lazy_import(name: str):
+    """Import an optional module the first time it is needed; None if not installed."""
+    if name not in _LAZY_MODULES:
+        try:
+            _LAZY_MODULES[name] = importlib.import_module(name)
+        except ImportError:
+            _LAZY_MODULES[name] = None
+    return _LAZY_MODULES[name]
+
+# Encoders by model name; building one re-parses its BPE ranks, so share them
+_ENCODER_CACHE: Dict[str, object] = {}
+
+
+def _get_token_encoder(model_name: str = "gpt-4"):
+    """Return a cached tiktoken encoder for the model (cl100k_base fallback), or None."""
+    tiktoken = _lazy_import("tiktoken")
+    if tiktoken is None:
+        return None
+    if model_name not in _ENCODER_CACHE:
+        try:
+            _ENCODER_CACHE[model_name] = tiktoken.encoding_for_model(model_name)
+        except Exception:
+            if "__cl100k__" not in _ENCODER_CACHE:
+                try:
+                    _ENCODER_CACHE["__cl100k__"] = tiktoken.get_encoding("cl100k_base")
+                except Exception as exc:
+                    logger.debug(f"Token encoder fallback failed: {exc}")
+                    _ENCODER_CACHE["__cl100k__"] = None
+            _ENCODER_CACHE[model_name] = _ENCODER_CACHE["__cl100k__"]
+    return _ENCODER_CACHE[model_name]
+
+
+# Below this many texts, encode sequentially; encode_batch starts a thread pool per call
+BATCH_ENCODE_MIN = 8
+
+
+def _token_counts_batch(encoder, texts: List[str]) -> List[int]:
+    """Per-text token counts with one encode_batch call (word heuristic fallback)."""
+    counts = [0] * len(texts)
+    nonempty = [i for i, t in enumerate(texts) if t]
+    if not nonempty:
+        return counts
+    if encoder:
+        try:
+            batch = [texts[i] for i in nonempty]
+            if len(batch) < BATCH_ENCODE_MIN:
+                encoded = [encoder.encode(t) for t in batch]
+            else:
+                encoded = encoder.encode_batch(batch, num_threads=os.cpu_count() or 1)
+            for i, tokens in zip(nonempty, encoded):
+                counts[i] = len(tokens)
+            return counts
+        except Exception as exc:
+            logger.debug(f"Batch token encoding error, using heuristic: {exc}")
+    for i in nonempty:
+        counts[i] = int(len(texts[i].split()) * 1.3)
+    return counts
+
+
+def _count_tokens_batch(encoder, texts: List[str]) -> int:
+    """Total token count of several texts with one encode_batch call (word heuristic fallback)."""
+    return sum(_token_counts_batch(encoder, texts))
+
+
+def _make_http_client() -> httpx.Client:
+    """Build the pooled client, using HTTP/2 when the optional h2 package is installed."""
+    kwargs = dict(
+        timeout=20,
+        limits=httpx.Limits(max_keepalive_connections=10, max_connections=20, keepalive_expiry=30.0),
+    )
+    try:
+        return httpx.Client(http2=True, **kwargs)
+    except ImportError:  # httpx[http2] not installed
+        return httpx.Client(**kwargs)
+
+
+# Pooled HTTP client shared by model-list fetches so refreshes reuse the TLS connection
+_HTTP_CLIENT = _make_http_client()
+atexit.register(_HTTP_CLIENT.close)
+
+# Last model list per provider, cached on disk between launches (models_<provider>.json).
+# The list is shown at once on load; OpenRouter skips the network while it is younger than the TTL
+MODEL_CACHE_DIR = Path.home() / ".cache" / "letta_gui"
+MODEL_CACHE_TTL = 600.0
+
+# Longest audio chunk captured before it is sent for recognition while dictating
+VOICE_PHRASE_LIMIT_S = 5
+
+# How often the Tk loop picks up results from background workers
+RESULT_POLL_MS = 50
+
+# How often queued log messages are flushed into the log pane
+LOG_FLUSH_INTERVAL_MS = 100
+
+# Archival list rows laid out per page; more are added as the list is scrolled to the end
+ARCH_LIST_PAGE = 200
+
+# Token bar color by usage: below 70% success, below 90% warning, else error
+TOKEN_BAND_THRESHOLDS = (0.7, 0.9)
+TOKEN_BAND_COLORS = ("success", "warning", "error")
+
+# Messages kept laid out in the conversation view (older ones stay in history only)
+MAX_RENDERED_MESSAGES = 200
+# ...and at most this many text lines, so a few very long messages cannot grow it unbounded
+MAX_RENDERED_LINES = 2000
+
+# Quiet period after the last keystroke before core-memory char counts refresh
+CHAR_COUNT_DEBOUNCE_MS = 100
+
+# Quiet period after the last keystroke in the archival search box before searching
+ARCH_SEARCH_DEBOUNCE_MS = 150
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent))
@@ -34,14 +149,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 # Load environment variables
 load_dotenv()
 
-from digital_humain.core.agent import AgentConfig, AgentRole
-from digital_humain.core.llm import OllamaProvider, OpenRouterProvider, LettaProvider
-from digital_humain.core.engine import AgentEngine
-from digital_humain.vlm.screen_analyzer import ScreenAnalyzer
-from digital_humain.vlm.actions import GUIActions
-from digital_humain.tools.base import ToolRegistry
-from digital_humain.tools.file_tools import FileReadTool, FileWriteTool, FileListTool
-from digital_humain.agents.automation_agent import DesktopAutomationAgent
+from digital_humain.core.llm import OllamaProvider
 from digital_humain.utils.config import load_config
 from digital_humain.memory.demonstration import DemonstrationMemory
 from digital_humain.memory.episodic import EpisodicMemory, MemorySummarizer
@@ -56,8 +164,20 @@ class CoreMemory:
         
         self.human = self._default_human_block()
         self.persona = self._default_persona_block()
+        self._prompt_cache: Optional[str] = None  # rebuilt after set_human/set_persona
         
-    def _default_human_block(self) -> str:
+    _PERSONA_BLOCK = """The following is a starter persona, and it can be expanded as the personality develops:
+
+I am a Desktop Automation AI Agent.
+I help users automate their desktop workflows using vision and reasoning.
+I'm curious, empathetic, and extraordinarily perceptive.
+I understand screen contents and can interact with any application.
+Thanks to my vision capabilities, I can see what you see.
+I have access to desktop automation tools and can learn from demonstrations."""
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _human_block_for(date: str) -> str:
         return """This is my section of core memory devoted to information about the human.
 They logged in for the first time on {date}.
 This is our first conversation.
@@ -66,17 +186,13 @@ What's their name?
 Where are they from?
 What do they do?
 Who are they?
-I should update this memory over time as I learn more about them.""".format(date=datetime.now().strftime("%Y-%m-%d"))
+I should update this memory over time as I learn more about them.""".format(date=date)
+    
+    def _default_human_block(self) -> str:
+        return self._human_block_for(datetime.now().strftime("%Y-%m-%d"))
     
     def _default_persona_block(self) -> str:
-        return """The following is a starter persona, and it can be expanded as the personality develops:
-
-I am a Desktop Automation AI Agent.
-I help users automate their desktop workflows using vision and reasoning.
-I'm curious, empathetic, and extraordinarily perceptive.
-I understand screen contents and can interact with any application.
-Thanks to my vision capabilities, I can see what you see.
-I have access to desktop automation tools and can learn from demonstrations."""
+        return self._PERSONA_BLOCK
     
     def get_human(self) -> str:
         return self.human
@@ -87,12 +203,14 @@ I have access to desktop automation tools and can learn from demonstrations."""
     def set_human(self, content: str) -> bool:
         if len(content) <= self.max_chars_human:
             self.human = content
+            self._prompt_cache = None
             return True
         return False
     
     def set_persona(self, content: str) -> bool:
         if len(content) <= self.max_chars_persona:
             self.persona = content
+            self._prompt_cache = None
             return True
         return False
     
@@ -103,11 +221,43 @@ I have access to desktop automation tools and can learn from demonstrations."""
         return len(self.persona), self.max_chars_persona
     
     def to_prompt(self) -> str:
-        return f"""### Core Memory - Human Context:
+        if self._prompt_cache is None:
+            self._prompt_cache = f"""### Core Memory - Human Context:
 {self.human}
 
 ### Core Memory - Persona:
 {self.persona}"""
+        return self._prompt_cache
+
+
+# Compiled multi-term archival queries kept per session
+QUERY_CACHE_SIZE = 128
+
+
+# Entries of at least this many words whose SimHash differs from an existing long
+# entry by at most NEAR_DUPLICATE_BITS are skipped; shorter entries only skip exact
+# repeats, since a one-word edit ("3pm" -> "4pm") is a real update there
+NEAR_DUPLICATE_MIN_WORDS = 30
+NEAR_DUPLICATE_BITS = 3
+
+_popcount = getattr(int, "bit_count", None) or (lambda x: bin(x).count("1"))
+
+
+def _simhash(words: List[str]) -> int:
+    """64-bit SimHash over words and word bigrams (so reordered text hashes differently)."""
+    features = words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+    bits = [
+        format(int.from_bytes(hashlib.blake2b(f.encode(), digest_size=8).digest(), "big"), "064b")
+        for f in features
+    ]
+    # Transpose once and count set bits per column instead of looping over 64 bits per feature
+    half = len(bits) / 2
+    return int("".join("1" if col.count("1") > half else "0" for col in zip(*bits)) or "0", 2)
+
+
+def _ngrams(text: str, n: int = 3) -> Set[str]:
+    """Return the set of character n-grams in text."""
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
 
 
 class ArchivalMemory:
@@ -119,18 +269,57 @@ class ArchivalMemory:
         self.max_tokens = max_tokens
         self.token_encoder = self._init_token_encoder()
         self.memories: List[Dict] = self._load_memories()
+        # Older archives stored a lowercased copy of each entry; drop it and rewrite once
+        stale = [memory.pop("content_lower", None) for memory in self.memories]
+        if any(lowered is not None for lowered in stale):
+            self._write_all(self.memories)
+        # Ids only grow, so a deleted memory's id is never handed out again
+        self._next_id = max((m["id"] for m in self.memories), default=-1) + 1
+        
+        # Trigram search index; keys are insertion-ordered, unlike the stored "id"
+        self._gram_index: Dict[str, Set[int]] = defaultdict(set)
+        self._entries: Dict[int, Dict] = {}
+        self._keys: Dict[int, int] = {}  # id(memory dict) -> index key
+        self._lowered: Dict[int, str] = {}  # index key -> lowercased content, matched by search
+        # Duplicate index, built on the first add() so startup does not pay for it
+        self._dedup_ready = False
+        self._exact: Dict[str, int] = {}  # normalized content -> number of entries with it
+        self._simhashes: Dict[int, int] = {}  # index key -> SimHash, long entries only
+        self._next_key = 0
+        self._lock = threading.RLock()  # search runs on a worker thread
+        self._query_cache: Dict[tuple, "re.Pattern"] = {}
+        for memory in self.memories:
+            self._index_memory(memory)
+    
+    def _index_memory(self, memory: Dict):
+        key = self._next_key
+        self._next_key += 1
+        self._entries[key] = memory
+        self._keys[id(memory)] = key
+        lowered = self._lowered[key] = memory["content"].lower()
+        if self._dedup_ready:
+            self._dedup_index(key, lowered)
+        for gram in _ngrams(lowered):
+            self._gram_index[gram].add(key)
+    
+    def _unindex_memory(self, memory: Dict):
+        key = self._keys.pop(id(memory), None)
+        if key is None:
+            return
+        del self._entries[key]
+        lowered = self._lowered.pop(key)
+        if self._dedup_ready:
+            self._dedup_unindex(key, lowered)
+        for gram in _ngrams(lowered):
+            posting = self._gram_index.get(gram)
+            if posting is not None:
+                posting.discard(key)
+                if not posting:
+                    del self._gram_index[gram]
     
     def _init_token_encoder(self, model_name: str = "gpt-4"):
         """Initialize token encoder; fall back to None if unavailable."""
-        if tiktoken is None:
-            return None
-        try:
-            return tiktoken.encoding_for_model(model_name)
-        except Exception:
-            try:
-                return tiktoken.get_encoding("cl100k_base")
-            except Exception:
-                return None
+        return _get_token_encoder(model_name)
     
     def _count_tokens(self, text: str) -> int:
         if not text:
@@ -143,7 +332,7 @@ class ArchivalMemory:
         return int(len(text.split()) * 1.3)
     
     def total_tokens(self) -> int:
-        return sum(self._count_tokens(m.get("content", "")) for m in self.memories)
+        return _count_tokens_batch(self.token_encoder, [m.get("content", "") for m in self.memories])
     
     def _enforce_limit(self):
         """Compact by dropping oldest memories when over token budget."""
@@ -153,40 +342,152 @@ class ArchivalMemory:
         pruned = 0
         while total > self.max_tokens and self.memories:
             removed = self.memories.pop(0)
+            self._unindex_memory(removed)
             total -= self._count_tokens(removed.get("content", ""))
             pruned += 1
         if pruned:
             logger.info(f"Archival compacted: removed {pruned} entries to stay under {self.max_tokens} tokens")
+        return pruned
     
     def _load_memories(self) -> List[Dict]:
-        archive_file = self.storage_path / "archival.json"
+        # One JSON object per line; the older single-array archival.json is migrated
+        archive_file = self.storage_path / "archival.jsonl"
         if archive_file.exists():
+            memories = []
+            with open(archive_file, 'r') as f:
+                for line in f:
+                    try:
+                        memories.append(json.loads(line))
+                    except ValueError:
+                        continue  # skip a torn trailing line
+            return memories
+        legacy_file = self.storage_path / "archival.json"
+        if legacy_file.exists():
             try:
-                return json.loads(archive_file.read_text())
+                memories = json.loads(legacy_file.read_text())
             except:
                 return []
+            self._write_all(memories)
+            return memories
         return []
     
+    def _write_all(self, memories: List[Dict]):
+        archive_file = self.storage_path / "archival.jsonl"
+        tmp_file = archive_file.with_suffix(".jsonl.tmp")
+        tmp_file.write_text("".join(json.dumps(m) + "\n" for m in memories))
+        tmp_file.replace(archive_file)
+    
     def _save_memories(self):
-        archive_file = self.storage_path / "archival.json"
-        archive_file.write_text(json.dumps(self.memories, indent=2))
+        """Rewrite the whole archive (needed after deletes and compaction)."""
+        self._write_all(self.memories)
+    
+    def _append_memory(self, memory: Dict):
+        with open(self.storage_path / "archival.jsonl", 'a') as f:
+            f.write(json.dumps(memory) + "\n")
+    
+    def _dedup_index(self, key: int, lowered: str):
+        words = lowered.split()
+        normalized = " ".join(words)
+        self._exact[normalized] = self._exact.get(normalized, 0) + 1
+        if len(words) >= NEAR_DUPLICATE_MIN_WORDS:
+            self._simhashes[key] = _simhash(words)
+    
+    def _dedup_unindex(self, key: int, lowered: str):
+        normalized = " ".join(lowered.split())
+        remaining = self._exact.get(normalized, 0) - 1
+        if remaining > 0:
+            self._exact[normalized] = remaining
+        else:
+            self._exact.pop(normalized, None)
+        self._simhashes.pop(key, None)
+    
+    def _is_duplicate(self, lowered: str) -> bool:
+        """True for an exact repeat, or a long entry whose SimHash is within NEAR_DUPLICATE_BITS of another."""
+        if not self._dedup_ready:
+            for key, text in self._lowered.items():
+                self._dedup_index(key, text)
+            self._dedup_ready = True
+        words = lowered.split()
+        if " ".join(words) in self._exact:
+            return True
+        if len(words) < NEAR_DUPLICATE_MIN_WORDS:
+            return False
+        h = _simhash(words)
+        return any(_popcount(h ^ other) <= NEAR_DUPLICATE_BITS for other in self._simhashes.values())
     
-    def add(self, content: str, metadata: Optional[Dict] = None):
+    def add(self, content: str, metadata: Optional[Dict] = None) -> bool:
+        """Store content unless it duplicates an existing memory; returns whether it was stored."""
         memory = {
-            "id": len(self.memories),
+            "id": None,  # assigned under the lock
             "timestamp": datetime.now().isoformat(),
             "content": content,
             "metadata": metadata or {}
         }
-        self.memories.append(memory)
-        self._enforce_limit()
-        self._save_memories()
+        with self._lock:
+            if self._is_duplicate(content.lower()):
+                logger.info("Skipped archival memory: duplicate of an existing entry")
+                return False
+            memory["id"] = self._next_id
+            self._next_id += 1
+            self.memories.append(memory)
+            self._index_memory(memory)
+            if self._enforce_limit():
+                self._save_memories()
+            else:
+                self._append_memory(memory)
+        return True
+    
+    def _candidate_keys(self, term: str) -> Optional[Set[int]]:
+        """Keys of memories containing every trigram of term; None if term is shorter than a trigram."""
+        grams = _ngrams(term)
+        if not grams:
+            return None
+        postings = sorted((self._gram_index.get(g, set()) for g in grams), key=len)
+        if not postings[0]:
+            return set()
+        # Intersect from the rarest gram so the working set only shrinks
+        return postings[0].intersection(*postings[1:])
+    
+    def _query_pattern(self, terms: List[str]) -> "re.Pattern":
+        """Compile an alternation of terms once and reuse it for repeated queries."""
+        key = tuple(terms)
+        pattern = self._query_cache.get(key)
+        if pattern is None:
+            if len(self._query_cache) >= QUERY_CACHE_SIZE:
+                self._query_cache.clear()
+            pattern = self._query_cache[key] = re.compile("|".join(map(re.escape, terms)))
+        return pattern
     
     def search(self, query: str, limit: int = 5) -> List[Dict]:
-        # Simple keyword search
-        query_lower = query.lower()
-        results = [m for m in self.memories if query_lower in m["content"].lower()]
-        return results[:limit]
+        # Substring search; "a|b" matches either term in one pass. Trigram postings
+        # narrow the candidates, terms shorter than a trigram scan everything
+        terms = [t for t in query.lower().split("|") if t]
+        if not terms:
+            return []
+        if len(terms) == 1:
+            term = terms[0]
+            matches = lambda text: term in text
+        else:
+            matches = self._query_pattern(terms).search
+        results = []
+        with self._lock:
+            keys = set()
+            for term in terms:
+                term_keys = self._candidate_keys(term)
+                if term_keys is None:
+                    keys = None
+                    break
+                keys |= term_keys
+            if keys is None:
+                keys = self._entries  # insertion order, same as self.memories
+            else:
+                keys = sorted(keys)
+            for k in keys:
+                if matches(self._lowered[k]):
+                    results.append(self._entries[k])
+                    if len(results) >= limit:
+                        break
+        return results
     
     def get_all(self) -> List[Dict]:
         return self.memories
@@ -195,40 +496,68 @@ class ArchivalMemory:
         return len(self.memories)
     
     def delete(self, memory_id: int) -> bool:
-        self.memories = [m for m in self.memories if m["id"] != memory_id]
-        self._save_memories()
+        with self._lock:
+            kept = []
+            for m in self.memories:
+                if m["id"] == memory_id:
+                    self._unindex_memory(m)
+                else:
+                    kept.append(m)
+            self.memories = kept
+            self._save_memories()
         return True
 
 
 class ConversationMessage:
     """Represents a message in the conversation."""
     
-    def __init__(self, role: str, content: str, timestamp: Optional[datetime] = None):
+    __slots__ = ("role", "content", "timestamp", "internal_reasoning", "token_count", "token_encoder")
+    
+    def __init__(self, role: str, content: str, timestamp: Optional[str] = None):
         self.role = role  # "user" or "agent"
         self.content = content
-        self.timestamp = timestamp or datetime.now()
+        self.timestamp = timestamp or datetime.now().isoformat()  # ISO-8601 string
         self.internal_reasoning = ""  # For agent reasoning display
+        # Tokens in content + reasoning, and the encoder they were counted with
+        self.token_count: Optional[int] = None
+        self.token_encoder = None
+    
+    def created_at(self) -> datetime:
+        return datetime.fromisoformat(self.timestamp)
     
     def to_dict(self) -> Dict:
         return {
             "role": self.role,
             "content": self.content,
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": self.timestamp,
             "reasoning": self.internal_reasoning
         }
 
 
 class TextHandler:
-    """Custom handler for redirecting logs to text widget."""
+    """Loguru sink that queues messages and flushes them into the widget on the Tk thread."""
     
     def __init__(self, text_widget):
         self.text_widget = text_widget
+        self._q = queue.SimpleQueue()
+        self.text_widget.after(LOG_FLUSH_INTERVAL_MS, self._flush)
 
     def write(self, message):
-        self.text_widget.configure(state='normal')
-        self.text_widget.insert(tk.END, message)
-        self.text_widget.see(tk.END)
-        self.text_widget.configure(state='disabled')
+        self._q.put(message)  # thread-safe; no Tk calls off the main thread
+
+    def _flush(self):
+        parts = []
+        while True:
+            try:
+                parts.append(self._q.get_nowait())
+            except queue.Empty:
+                break
+        if parts:
+            self.text_widget.configure(state='normal')
+            self.text_widget.insert(tk.END, "".join(parts))
+            self.text_widget.see(tk.END)
+            self.text_widget.configure(state='disabled')
+        self.text_widget.after(LOG_FLUSH_INTERVAL_MS, self._flush)
 
 
 class LettaStyleGUI:
@@ -248,6 +577,8 @@ class LettaStyleGUI:
         
         # Conversation history
         self.conversation: List[ConversationMessage] = []
+        self._rendered_lines = deque()  # line count of each message shown in conv_text
+        self._rendered_line_total = 0
         
         # Agent state
         self.current_models = []
@@ -255,9 +586,32 @@ class LettaStyleGUI:
         self.agent_thread = None
         self.provider_health_status = "unknown"
         self.provider_health_message = ""
+        self._health_drawn: Optional[str] = None  # status the health dot currently shows
         self.token_count = 0
         self.max_tokens = 8192
         self.token_encoder = self._init_token_encoder()
+        self._token_bar_state = None  # (bar_width, color) last drawn
+        self._char_count_after: Dict[str, Optional[str]] = {}  # block -> pending after() id
+        
+        # Background work (archival search etc.); results come back through the queue
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="letta-worker")
+        # Dictated chunks are recognised one at a time so they reach the input box in order
+        self._voice_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="letta-voice")
+        self._result_queue: "queue.Queue" = queue.Queue()
+        # One event loop thread multiplexes agent calls (providers expose async generate())
+        self._async_loop = asyncio.new_event_loop()
+        threading.Thread(target=self._async_loop.run_forever, name="letta-async", daemon=True).start()
+        self._search_gen = 0
+        self._search_future = None  # latest archival search, cancelled if superseded before it starts
+        self._stop_listening = None  # stops background voice capture while dictating
+        self._load_gen = 0  # bumped per model-list load; stale results are dropped
+        self._ollama_provider: Optional[OllamaProvider] = None  # keeps its pooled client across loads
+        self._arch_rows: List[Dict] = []  # memories behind arch_listbox rows, in display order
+        self._arch_rendered = 0  # how many of _arch_rows are inserted in the listbox
+        self._arch_previews: Dict[int, tuple] = {}  # memory id -> (content, preview row)
+        self._arch_all_cache: Optional[List[Dict]] = None  # snapshot of get_all(); reset on add/delete
+        self._arch_search_after_id: Optional[str] = None
+        self._tab_update_pending = False
 
         # Model filtering controls (OpenRouter and others)
         self.filter_var = tk.StringVar()
@@ -265,38 +619,43 @@ class LettaStyleGUI:
         
         self._init_style()
         self.setup_ui()
-        self._detect_initial_provider()
         self.load_models()
+        self.root.after(RESULT_POLL_MS, self._drain_results)
 
     def _init_token_encoder(self, model_name: str = "gpt-4"):
         """Initialize tiktoken encoder for accurate token counts."""
-        if tiktoken is None:
+        if _lazy_import("tiktoken") is None:
             logger.warning("tiktoken not installed; using approximate token counts")
             return None
-        try:
-            return tiktoken.encoding_for_model(model_name)
-        except Exception:
-            try:
-                return tiktoken.get_encoding("cl100k_base")
-            except Exception as exc:
-                logger.debug(f"Token encoder fallback failed: {exc}")
-                return None
-
-    def _count_tokens(self, text: str) -> int:
-        """Return token count using encoder with safe fallback."""
-        if not text:
-            return 0
-        if self.token_encoder:
-            try:
-                return len(self.token_encoder.encode(text))
-            except Exception as exc:
-                logger.debug(f"Token encoding error, using heuristic: {exc}")
-        return int(len(text.split()) * 1.3)
+        return _get_token_encoder(model_name)
 
     def _refresh_token_encoder(self, model_name: Optional[str] = None):
         """Refresh encoder when model selection changes."""
         if model_name:
-            self.token_encoder = self._init_token_encoder(model_name)
+            encoder = self._init_token_encoder(model_name)
+            if encoder is not self.token_encoder:
+                self.token_encoder = encoder
+                self._recount_tokens()
+
+    def _count_message_tokens(self, messages: List[ConversationMessage]):
+        """Fill in token counts for messages not yet counted with the current encoder."""
+        stale = [m for m in messages if m.token_count is None or m.token_encoder is not self.token_encoder]
+        if not stale:
+            return
+        texts = []
+        for msg in stale:
+            texts.append(msg.content)
+            texts.append(msg.internal_reasoning)
+        counts = _token_counts_batch(self.token_encoder, texts)
+        for i, msg in enumerate(stale):
+            msg.token_count = counts[2 * i] + counts[2 * i + 1]
+            msg.token_encoder = self.token_encoder
+    
+    def _recount_tokens(self):
+        """Recount the conversation, encoding only messages counted with another encoder."""
+        self._count_message_tokens(self.conversation)
+        self.token_count = sum(msg.token_count for msg in self.conversation)
+        self._update_token_display()
         
     def _init_style(self):
         """Initialize modern color scheme."""
@@ -475,7 +834,7 @@ class LettaStyleGUI:
         
         btn_frame = ttk.Frame(llm_frame)
         btn_frame.pack(fill=tk.X, pady=5)
-        ttk.Button(btn_frame, text="Refresh", command=self.load_models, width=10).pack(side=tk.LEFT, padx=2)
+        ttk.Button(btn_frame, text="Refresh", command=lambda: self.load_models(force=True), width=10).pack(side=tk.LEFT, padx=2)
         ttk.Button(btn_frame, text="Set Key", command=self._set_env_api_key, width=10).pack(side=tk.LEFT, padx=2)
         
         # Agent Type
@@ -698,6 +1057,8 @@ class LettaStyleGUI:
                                                        fill=self.colors["success"],
                                                        outline="")
         self.token_canvas = token_canvas
+        self._token_canvas_width = 0  # tracked via <Configure> instead of queried per update
+        token_canvas.bind("<Configure>", self._on_token_canvas_resize)
         
         # Tabs for Core/Archival Memory
         memory_notebook = ttk.Notebook(parent)
@@ -738,7 +1099,7 @@ class LettaStyleGUI:
                                                     font=("Segoe UI", 9))
         self.human_text.pack(fill=tk.BOTH, expand=True, pady=5)
         self.human_text.insert("1.0", self.core_memory.get_human())
-        self.human_text.bind("<KeyRelease>", lambda e: self._update_human_chars())
+        self.human_text.bind("<KeyRelease>", lambda e: self._debounce_chars("human", self._update_human_chars))
         
         ttk.Button(human_frame, text="💾 Save", command=self._save_human_memory).pack()
         
@@ -760,7 +1121,7 @@ class LettaStyleGUI:
                                                       font=("Segoe UI", 9))
         self.persona_text.pack(fill=tk.BOTH, expand=True, pady=5)
         self.persona_text.insert("1.0", self.core_memory.get_persona())
-        self.persona_text.bind("<KeyRelease>", lambda e: self._update_persona_chars())
+        self.persona_text.bind("<KeyRelease>", lambda e: self._debounce_chars("persona", self._update_persona_chars))
         
         ttk.Button(persona_frame, text="💾 Save", command=self._save_persona_memory).pack()
     
@@ -771,6 +1132,7 @@ class LettaStyleGUI:
         search_frame.pack(fill=tk.X, padx=5, pady=5)
         
         self.arch_search_var = tk.StringVar()
+        self.arch_search_var.trace_add("write", lambda *_: self._debounce_archival_search())
         search_entry = ttk.Entry(search_frame, textvariable=self.arch_search_var)
         search_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 5))
         
@@ -791,7 +1153,8 @@ class LettaStyleGUI:
         scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL,
                                  command=self.arch_listbox.yview)
         scrollbar.pack(side=tk.LEFT, fill=tk.Y)
-        self.arch_listbox.config(yscrollcommand=scrollbar.set)
+        self._arch_scrollbar = scrollbar
+        self.arch_listbox.config(yscrollcommand=self._on_arch_yscroll)
         
         # Controls
         ctrl_frame = ttk.Frame(parent)
@@ -804,9 +1167,27 @@ class LettaStyleGUI:
         self._refresh_archival_list()
     
     # Memory management methods
+    def _debounce_chars(self, block: str, update):
+        """Run a char-count update once typing in a block pauses for CHAR_COUNT_DEBOUNCE_MS."""
+        pending = self._char_count_after.get(block)
+        if pending is not None:
+            self.root.after_cancel(pending)
+        self._char_count_after[block] = self.root.after(CHAR_COUNT_DEBOUNCE_MS, self._run_char_count, block, update)
+
+    def _run_char_count(self, block: str, update):
+        self._char_count_after[block] = None
+        update()
+
+    @staticmethod
+    def _text_length(widget) -> int:
+        """Character count of a Text widget, counted by Tk without copying the buffer."""
+        counted = widget.count("1.0", "end-1c", "chars")
+        if not counted:
+            return 0
+        return counted[0] if isinstance(counted, tuple) else counted
+    
     def _update_human_chars(self):
-        content = self.human_text.get("1.0", "end-1c")
-        current_len = len(content)
+        current_len = self._text_length(self.human_text)
         max_len = self.core_memory.max_chars_human
         self.human_char_label.config(text=f"{current_len}/{max_len} CHARS")
         
@@ -816,8 +1197,7 @@ class LettaStyleGUI:
             self.human_char_label.config(foreground=self.colors["text_muted"])
     
     def _update_persona_chars(self):
-        content = self.persona_text.get("1.0", "end-1c")
-        current_len = len(content)
+        current_len = self._text_length(self.persona_text)
         max_len = self.core_memory.max_chars_persona
         self.persona_char_label.config(text=f"{current_len}/{max_len} CHARS")
         
@@ -842,31 +1222,115 @@ class LettaStyleGUI:
     
     def _refresh_archival_list(self):
         """Refresh archival memory list."""
+        self._show_archival_rows(self._arch_all())
+        
+        # Update tab label (if notebook exists) once Tk is idle, coalescing chained refreshes
+        if hasattr(self, 'memory_notebook') and not self._tab_update_pending:
+            self._tab_update_pending = True
+            self.root.after_idle(self._update_archival_tab)
+    
+    def _update_archival_tab(self):
+        self._tab_update_pending = False
+        count = self.archival_memory.count()
+        self.memory_notebook.tab(1, text=f"Archival Memory ({count})")
+    
+    def _arch_all(self) -> List[Dict]:
+        if self._arch_all_cache is None:
+            self._arch_all_cache = list(self.archival_memory.get_all())
+            # Drop previews of memories that compaction or a delete removed
+            live = {mem["id"] for mem in self._arch_all_cache}
+            for mem_id in [i for i in self._arch_previews if i not in live]:
+                del self._arch_previews[mem_id]
+        return self._arch_all_cache
+    
+    def _arch_preview(self, mem: Dict) -> str:
+        content = mem["content"]
+        cached = self._arch_previews.get(mem["id"])
+        if cached is not None and cached[0] is content:
+            return cached[1]
+        row = f"[{mem['id']}] {content[:60]}{'...' if content[60:61] else ''}"
+        self._arch_previews[mem["id"]] = (content, row)
+        return row
+    
+    def _show_archival_rows(self, rows: List[Dict]):
+        """Show memories in the archival list, laying out one page at a time."""
+        self._arch_rows = rows
+        self._arch_rendered = 0
         self.arch_listbox.delete(0, tk.END)
-        for mem in self.archival_memory.get_all():
-            preview = mem["content"][:60] + "..." if len(mem["content"]) > 60 else mem["content"]
-            self.arch_listbox.insert(tk.END, f"[{mem['id']}] {preview}")
-        
-        # Update tab label (if notebook exists)
-        if hasattr(self, 'memory_notebook'):
-            count = self.archival_memory.count()
-            self.memory_notebook.tab(1, text=f"Archival Memory ({count})")
+        self._render_archival_page()
+    
+    def _render_archival_page(self):
+        page = self._arch_rows[self._arch_rendered:self._arch_rendered + ARCH_LIST_PAGE]
+        if page:
+            self.arch_listbox.insert(tk.END, *(self._arch_preview(m) for m in page))
+            self._arch_rendered += len(page)
+    
+    def _on_arch_yscroll(self, first, last):
+        """Keep the scrollbar in sync and lay out the next page once the end is visible."""
+        self._arch_scrollbar.set(first, last)
+        if float(last) >= 1.0 and self._arch_rendered < len(self._arch_rows):
+            self._render_archival_page()
+    
+    def _submit(self, fn, *args, on_done, executor=None):
+        """Run fn on the worker pool (or the given executor) and hand its future to on_done on the Tk thread."""
+        future = (executor or self._executor).submit(fn, *args)
+        future.add_done_callback(lambda f: self._result_queue.put((on_done, f)))
+        return future
+    
+    def _submit_async(self, coro, on_done):
+        """Schedule coro on the background event loop and hand its future to on_done on the Tk thread."""
+        future = asyncio.run_coroutine_threadsafe(coro, self._async_loop)
+        future.add_done_callback(lambda f: self._result_queue.put((on_done, f)))
+        return future
+    
+    def _drain_results(self):
+        """Deliver finished background work to its callbacks on the Tk thread."""
+        try:
+            while True:
+                on_done, future = self._result_queue.get_nowait()
+                try:
+                    on_done(future)
+                except Exception as e:
+                    logger.error(f"Background result handler failed: {e}")
+        except queue.Empty:
+            pass
+        self.root.after(RESULT_POLL_MS, self._drain_results)
+    
+    def _debounce_archival_search(self):
+        """Search as the user types, once typing pauses for ARCH_SEARCH_DEBOUNCE_MS."""
+        if self._arch_search_after_id is not None:
+            self.root.after_cancel(self._arch_search_after_id)
+        self._arch_search_after_id = self.root.after(ARCH_SEARCH_DEBOUNCE_MS, self._search_archival)
     
     def _search_archival(self):
         """Search archival memory."""
+        if self._arch_search_after_id is not None:
+            self.root.after_cancel(self._arch_search_after_id)
+            self._arch_search_after_id = None
+        self._search_gen += 1
+        if self._search_future is not None:
+            self._search_future.cancel()
+            self._search_future = None
         query = self.arch_search_var.get().strip()
         if not query:
             self._refresh_archival_list()
             return
         
-        results = self.archival_memory.search(query)
-        self.arch_listbox.delete(0, tk.END)
-        
-        if results:
-            for mem in results:
-                preview = mem["content"][:60] + "..." if len(mem["content"]) > 60 else mem["content"]
-                self.arch_listbox.insert(tk.END, f"[{mem['id']}] {preview}")
-        else:
+        gen = self._search_gen
+        self._search_future = self._submit(self.archival_memory.search, query, 5,
+                                           on_done=lambda f: self._show_search_results(gen, f))
+    
+    def _show_search_results(self, gen: int, future):
+        """Fill the archival list with search results unless a newer search superseded them."""
+        if gen != self._search_gen or future.cancelled():
+            return
+        try:
+            results = future.result()
+        except Exception as e:
+            logger.error(f"Archival search failed: {e}")
+            return
+        self._show_archival_rows(results)
+        if not results:
             self.arch_listbox.insert(tk.END, "No results found")
     
     def _add_archival(self):
@@ -886,11 +1350,18 @@ class LettaStyleGUI:
         
         def save():
             content = text_widget.get("1.0", "end-1c").strip()
-            if content:
-                self.archival_memory.add(content)
-                self._refresh_archival_list()
-                logger.success("Memory added to archival")
-                dialog.destroy()
+            if not content:
+                return
+            if not self.archival_memory.add(content):
+                # Keep the dialog open so the text can be edited or discarded
+                messagebox.showwarning(
+                    "Not Saved", "This memory (or a near-duplicate of it) already exists.", parent=dialog
+                )
+                return
+            self._arch_all_cache = None
+            self._refresh_archival_list()
+            logger.success("Memory added to archival")
+            dialog.destroy()
         
         ttk.Button(dialog, text="Save", command=save).pack(pady=10)
     
@@ -901,9 +1372,8 @@ class LettaStyleGUI:
             return
         
         idx = selection[0]
-        memories = self.archival_memory.get_all()
-        if idx < len(memories):
-            mem = memories[idx]
+        if idx < len(self._arch_rows):
+            mem = self._arch_rows[idx]
             messagebox.showinfo(f"Memory #{mem['id']}", 
                               f"Timestamp: {mem['timestamp']}\n\n{mem['content']}")
     
@@ -914,33 +1384,36 @@ class LettaStyleGUI:
             return
         
         idx = selection[0]
-        memories = self.archival_memory.get_all()
-        if idx < len(memories):
-            mem = memories[idx]
+        if idx < len(self._arch_rows):
+            mem = self._arch_rows[idx]
             if messagebox.askyesno("Confirm", f"Delete memory #{mem['id']}?"):
                 self.archival_memory.delete(mem["id"])
+                self._arch_previews.pop(mem["id"], None)
+                self._arch_all_cache = None
                 self._refresh_archival_list()
                 logger.info(f"Memory #{mem['id']} deleted")
     
+    def _on_token_canvas_resize(self, event):
+        self._token_canvas_width = event.width
+        self._update_token_display()
+    
     def _update_token_display(self):
         """Update token count display and progress bar."""
         self.token_label.config(text=f"{self.token_count}/{self.max_tokens} TOKENS")
         
         # Update progress bar
-        width = self.token_canvas.winfo_width()
+        width = self._token_canvas_width
         progress = min(1.0, self.token_count / self.max_tokens)
         bar_width = int(width * progress)
         
         # Color based on usage
-        if progress < 0.7:
-            color = self.colors["success"]
-        elif progress < 0.9:
-            color = self.colors["warning"]
-        else:
-            color = self.colors["error"]
+        color = self.colors[TOKEN_BAND_COLORS[bisect_right(TOKEN_BAND_THRESHOLDS, progress)]]
         
-        self.token_canvas.coords(self.token_bar, 0, 0, bar_width, 8)
-        self.token_canvas.itemconfig(self.token_bar, fill=color)
+        # Only touch the canvas when the bar visibly changes
+        if self._token_bar_state != (bar_width, color):
+            self._token_bar_state = (bar_width, color)
+            self.token_canvas.coords(self.token_bar, 0, 0, bar_width, 8)
+            self.token_canvas.itemconfig(self.token_bar, fill=color)
     
     # Conversation methods
     def add_message(self, role: str, content: str, reasoning: str = ""):
@@ -952,27 +1425,51 @@ class LettaStyleGUI:
         self.conv_text.configure(state='normal')
         
         # Timestamp
-        timestamp = msg.timestamp.strftime("%H:%M:%S")
-        self.conv_text.insert(tk.END, f"[{timestamp}] ", "timestamp")
+        timestamp = msg.timestamp[11:19]  # HH:MM:SS of the ISO string
+        segments = [(f"[{timestamp}] ", "timestamp")]
         
         # Role and content
         if role == "user":
-            self.conv_text.insert(tk.END, "👤 USER\n", "user")
-            self.conv_text.insert(tk.END, f"{content}\n\n")
+            segments.append(("👤 USER\n", "user"))
+            segments.append((f"{content}\n\n", None))
         else:  # agent
-            self.conv_text.insert(tk.END, "🤖 AGENT\n", "agent")
+            segments.append(("🤖 AGENT\n", "agent"))
             if reasoning:
-                self.conv_text.insert(tk.END, f"💭 Reasoning\n", "agent")
-                self.conv_text.insert(tk.END, f"{reasoning}\n\n", "reasoning")
-            self.conv_text.insert(tk.END, f"{content}\n\n")
-        
-        self.conv_text.see(tk.END)
+                segments.append((f"💭 Reasoning\n", "agent"))
+                segments.append((f"{reasoning}\n\n", "reasoning"))
+            segments.append((f"{content}\n\n", None))
+        
+        # Follow new output only if the user was already at the bottom
+        at_bottom = self.conv_text.yview()[1] > 0.99
+        # One insert call carrying every (text, tags) pair
+        args = []
+        for text, tag in segments:
+            args.extend((text, tag or ""))
+        self.conv_text.insert(tk.END, *args)
+        
+        # Only the most recent messages stay laid out in the widget; the full
+        # history remains in self.conversation
+        lines = sum(text.count("\n") for text, _ in segments)
+        self._rendered_lines.append(lines)
+        self._rendered_line_total += lines
+        trim = 0
+        while len(self._rendered_lines) > 1 and (
+            len(self._rendered_lines) > MAX_RENDERED_MESSAGES
+            or self._rendered_line_total > MAX_RENDERED_LINES
+        ):
+            oldest = self._rendered_lines.popleft()
+            self._rendered_line_total -= oldest
+            trim += oldest
+        if trim:
+            self.conv_text.delete("1.0", f"{trim + 1}.0")
+        
+        if at_bottom:
+            self.conv_text.see(tk.END)
         self.conv_text.configure(state='disabled')
         
         # Update token count using encoder (content + reasoning)
-        self.token_count += self._count_tokens(content)
-        if reasoning:
-            self.token_count += self._count_tokens(reasoning)
+        self._count_message_tokens([msg])
+        self.token_count += msg.token_count
         self._update_token_display()
     
     def send_message(self):
@@ -986,18 +1483,26 @@ class LettaStyleGUI:
         
         # Process message (would trigger agent)
         # For now, just acknowledge
-        threading.Thread(target=self._process_message, args=(content,), daemon=True).start()
+        self._submit_async(self._process_message(content), on_done=self._show_agent_reply)
     
-    def _process_message(self, user_input: str):
-        """Process user message and generate response."""
-        # This is where you'd call the actual agent
+    async def _process_message(self, user_input: str) -> tuple:
+        """Process user message and generate (response, reasoning); runs on the event loop thread."""
+        # This is where you'd await the actual agent (e.g. provider.generate)
         # For now, placeholder
-        import time
-        time.sleep(1)
+        await asyncio.sleep(1)
         
         reasoning = "I should analyze what the user wants and determine the best approach."
         response = f"I understand you want to: {user_input}. Let me help with that."
         
+        return response, reasoning
+    
+    def _show_agent_reply(self, future):
+        """Render the agent's reply on the Tk thread."""
+        try:
+            response, reasoning = future.result()
+        except Exception as e:
+            logger.error(f"Agent response failed: {e}")
+            return
         self.add_message("agent", response, reasoning)
     
     def run_conversation(self):
@@ -1014,43 +1519,108 @@ class LettaStyleGUI:
         self.conv_text.configure(state='normal')
         self.conv_text.delete("1.0", tk.END)
         self.conv_text.configure(state='disabled')
+        self._rendered_lines.clear()
+        self._rendered_line_total = 0
         self.token_count = 0
         self._update_token_display()
         logger.info("Conversation cleared")
     
     # LLM methods (similar to original)
-    def load_models(self):
+    def load_models(self, force: bool = False):
+        """Fetch the provider's model list on the worker pool; the combo fills in when it arrives.
+        
+        force skips the on-disk OpenRouter model cache (used by the Refresh button).
+        """
+        self._load_gen += 1
+        gen = self._load_gen
         provider = self.provider_var.get()
+        api_key = self.api_key_var.get().strip()
+        self._update_health_indicator("unknown", f"{provider}: checking...")
+        # Show the last known list right away; the fetch below revalidates it
+        cached = self._read_model_cache(provider)
+        if cached:
+            self.current_models = cached
+            self.apply_filter()
+        self._submit(self._fetch_models, provider, api_key, force,
+                     on_done=lambda f: self._apply_models(gen, f))
+    
+    def _fetch_models(self, provider: str, api_key: str, force: bool = False) -> Optional[tuple]:
+        """Return (provider, models, health status, health message); runs on a worker thread."""
         if provider == "ollama":
-            self._load_ollama_models()
+            return self._load_ollama_models(api_key, force)
         elif provider == "openrouter":
-            self._load_openrouter_models()
+            return self._load_openrouter_models(api_key, force)
         elif provider == "letta":
-            self._load_letta_models()
+            return self._load_letta_models(api_key)
+        return None
     
-    def _load_ollama_models(self):
+    def _apply_models(self, gen: int, future):
+        """Show a fetched model list unless a newer load superseded it."""
+        if gen != self._load_gen:
+            return
+        try:
+            result = future.result()
+        except Exception as e:
+            logger.error(f"Model list load failed: {e}")
+            return
+        if result is None:
+            return
+        provider, models, status, message = result
+        if self.provider_var.get() != provider:
+            self.provider_var.set(provider)
+        self.current_models = models
+        self.apply_filter()
+        self._update_health_indicator(status, message)
+    
+    def _load_ollama_models(self, api_key: str, force: bool = False) -> tuple:
         try:
-            provider = OllamaProvider()
-            models_meta = provider.list_models()
+            if self._ollama_provider is None:
+                self._ollama_provider = OllamaProvider()
+            models_meta = self._ollama_provider.list_models()
             model_names = [m.get("name") or m.get("model") or m.get("id") 
                           for m in models_meta if m.get("name") or m.get("model") or m.get("id")]
             
             if not model_names:
                 raise RuntimeError("No models found")
             
-            self.current_models = model_names
-            self.apply_filter()
-            self._update_health_indicator("healthy", "Ollama: Connected")
+            self._write_model_cache("ollama", model_names)
+            return "ollama", model_names, "healthy", "Ollama: Connected"
         except Exception as e:
             logger.warning(f"Ollama unavailable: {e}")
-            self._update_health_indicator("unhealthy", f"Ollama: {str(e)[:50]}")
-            self.provider_var.set("openrouter")
-            self._load_openrouter_models()
+            return self._load_openrouter_models(api_key, force)
+    
+    def _read_model_cache(self, provider: str, base_url: Optional[str] = None,
+                          max_age: Optional[float] = None) -> Optional[List[str]]:
+        """Return the provider's disk-cached model list, optionally only if fresh and for base_url."""
+        try:
+            cached = json.loads((MODEL_CACHE_DIR / f"models_{provider}.json").read_text())
+        except (OSError, ValueError):
+            return None
+        if base_url is not None and cached.get("base_url") != base_url:
+            return None
+        if max_age is not None and time.time() - cached.get("ts", 0) >= max_age:
+            return None
+        return cached.get("models") or None
+    
+    def _write_model_cache(self, provider: str, models: List[str], base_url: Optional[str] = None):
+        cache_file = MODEL_CACHE_DIR / f"models_{provider}.json"
+        tmp_file = cache_file.with_suffix(".json.tmp")
+        try:
+            MODEL_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp_file.write_text(json.dumps({"ts": time.time(), "base_url": base_url, "models": models}))
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            logger.debug(f"Could not write model cache: {e}")
     
-    def _load_openrouter_models(self):
+    def _load_openrouter_models(self, api_key: str, force: bool = False) -> tuple:
         config = load_config()
         base_url = config.get("llm", {}).get("openrouter", {}).get("base_url", "https://openrouter.ai/api/v1")
-        api_key = self.api_key_var.get().strip() or os.environ.get("OPENROUTER_API_KEY", "")
+        api_key = api_key or os.environ.get("OPENROUTER_API_KEY", "")
+        
+        if not force:
+            models = self._read_model_cache("openrouter", base_url, MODEL_CACHE_TTL)
+            if models:
+                return "openrouter", models, "healthy", "OpenRouter: Connected (cached)"
         
         fallback_models = [
             "openrouter/nvidia/nemotron-nano-12b-v2-vl:free",
@@ -1059,35 +1629,28 @@ class LettaStyleGUI:
         ]
         
         try:
-            with httpx.Client(timeout=20) as client:
-                resp = client.get(f"{base_url.rstrip('/')}/models",
-                                headers={"Authorization": f"Bearer {api_key}"} if api_key else {})
-                resp.raise_for_status()
-                models = [item.get("id") for item in resp.json().get("data", []) if item.get("id")]
-                
-                if models:
-                    self.current_models = models
-                    self.apply_filter()
-                    self._update_health_indicator("healthy", "OpenRouter: Connected")
-                    return
+            resp = _HTTP_CLIENT.get(f"{base_url.rstrip('/')}/models",
+                                    headers={"Authorization": f"Bearer {api_key}"} if api_key else {})
+            resp.raise_for_status()
+            models = [item.get("id") for item in resp.json().get("data", []) if item.get("id")]
+            
+            if models:
+                self._write_model_cache("openrouter", models, base_url)
+                return "openrouter", models, "healthy", "OpenRouter: Connected"
         except Exception as e:
             logger.warning(f"OpenRouter fetch failed: {e}")
         
-        self.current_models = fallback_models
-        self.apply_filter()
-        self._update_health_indicator("healthy" if api_key else "unhealthy",
-                                     "OpenRouter: Using fallback" if api_key else "No API key")
+        return ("openrouter", fallback_models, "healthy" if api_key else "unhealthy",
+                "OpenRouter: Using fallback" if api_key else "No API key")
     
-    def _load_letta_models(self):
-        self.current_models = [
+    def _load_letta_models(self, api_key: str) -> tuple:
+        models = [
             "openrouter/nvidia/nemotron-nano-12b-v2-vl:free",
             "openrouter/qwen/qwen-2-7b-instruct",
         ]
-        self.apply_filter()
-        
-        api_key = self.api_key_var.get().strip() or os.environ.get("LETTA_API_KEY", "")
-        self._update_health_indicator("healthy" if api_key else "unhealthy",
-                                     "Letta: " + ("Configured" if api_key else "No API key"))
+        api_key = api_key or os.environ.get("LETTA_API_KEY", "")
+        return ("letta", models, "healthy" if api_key else "unhealthy",
+                "Letta: " + ("Configured" if api_key else "No API key"))
     
     def apply_filter(self):
         models = list(getattr(self, "current_models", []) or [])
@@ -1117,21 +1680,12 @@ class LettaStyleGUI:
 
         self._refresh_token_encoder(self.model_var.get())
     
-    def _detect_initial_provider(self):
-        try:
-            provider = OllamaProvider()
-            if provider.list_models():
-                self.provider_var.set("ollama")
-                return
-        except:
-            pass
-        
-        if os.environ.get("OPENROUTER_API_KEY"):
-            self.provider_var.set("openrouter")
-    
     def _update_health_indicator(self, status: str, message: str):
         self.provider_health_status = status
         self.provider_health_message = message
+        if status == self._health_drawn:
+            return
+        self._health_drawn = status
         
         colors = {
             "healthy": "#10b981",
@@ -1165,24 +1719,47 @@ class LettaStyleGUI:
         self.root.clipboard_append(content)
     
     def voice_to_text(self):
+        """Toggle dictation: audio is captured in the background and recognised chunk by chunk."""
+        if self._stop_listening is not None:
+            self._stop_listening(wait_for_stop=False)
+            self._stop_listening = None
+            logger.info("Stopped listening")
+            return
+        
+        sr = _lazy_import("speech_recognition")
         if sr is None:
             logger.error("speech_recognition not installed")
             return
         
-        def capture():
-            try:
-                recognizer = sr.Recognizer()
-                with sr.Microphone() as source:
-                    logger.info("Listening...")
-                    audio = recognizer.listen(source, timeout=5)
-                    text = recognizer.recognize_google(audio)
-                    self.input_text.delete("1.0", tk.END)
-                    self.input_text.insert("1.0", text)
-                    logger.success(f"Voice captured: {text}")
-            except Exception as e:
-                logger.error(f"Voice capture failed: {e}")
+        recognizer = sr.Recognizer()
         
-        threading.Thread(target=capture, daemon=True).start()
+        def on_audio(recognizer, audio):
+            # Recognise off the capture thread so the next chunk is not held up; the
+            # single-worker voice executor keeps phrases in the order they were spoken
+            self._submit(recognizer.recognize_google, audio, on_done=self._append_voice_text,
+                         executor=self._voice_executor)
+        
+        try:
+            self._stop_listening = recognizer.listen_in_background(
+                sr.Microphone(), on_audio, phrase_time_limit=VOICE_PHRASE_LIMIT_S)
+            logger.info("Listening... press Voice again to stop")
+        except Exception as e:
+            logger.error(f"Voice capture failed: {e}")
+    
+    def _append_voice_text(self, future):
+        """Append a recognised chunk to the input box on the Tk thread."""
+        try:
+            text = future.result()
+        except Exception as e:
+            # Chunks of silence or unintelligible audio are expected while dictating
+            logger.debug(f"Voice chunk not recognised: {e}")
+            return
+        if not text:
+            return
+        if self.input_text.get("end-2c", "end-1c").strip():
+            text = " " + text
+        self.input_text.insert(tk.END, text)
+        logger.success(f"Voice captured: {text.strip()}")
     
     def start_task(self):
         logger.info("Task started (placeholder)")
@@ -58,6 +58,7 @@ base_requirements = parse_requirements("requirements.txt")
 extras_require = {
     "gui": [
         "tkinter",  # Usually included with Python
+        "httpx[http2]>=0.25.0",  # HTTP/2 for the GUI's pooled OpenRouter client
     ],
     "dev": [
         "pytest>=7.4.0",
@@ -0,0 +1,63 @@
+"""Unit tests for letta_gui's archival memory duplicate check."""
+
+import json
+
+import pytest
+
+from letta_gui import ArchivalMemory, NEAR_DUPLICATE_MIN_WORDS
+
+
+LONG_TEXT = " ".join(
+    f"the quarterly planning notes cover item {i} for the platform team" for i in range(6)
+)
+
+
+@pytest.fixture
+def archive(tmp_path):
+    return ArchivalMemory(storage_path=tmp_path)
+
+
+class TestArchivalDuplicates:
+    """Test which additions ArchivalMemory.add skips."""
+
+    def test_exact_repeat_is_skipped(self, archive):
+        assert archive.add("Meeting moved to 3pm")
+        assert not archive.add("meeting  moved to 3PM")
+        assert archive.count() == 1
+
+    def test_short_edit_is_stored(self, archive):
+        assert archive.add("Meeting moved to 3pm")
+        assert archive.add("Meeting moved to 4pm")
+        assert archive.count() == 2
+
+    def test_long_near_duplicate_is_skipped(self, archive):
+        assert len(LONG_TEXT.split()) >= NEAR_DUPLICATE_MIN_WORDS
+        assert archive.add(LONG_TEXT)
+        assert not archive.add(LONG_TEXT + " today")
+        assert archive.count() == 1
+
+    def test_long_unrelated_text_is_stored(self, archive):
+        other = " ".join(
+            f"shipping schedule for warehouse {i} changes next month after review" for i in range(6)
+        )
+        assert archive.add(LONG_TEXT)
+        assert archive.add(other)
+        assert archive.count() == 2
+
+    def test_deleted_entry_can_be_added_again(self, archive):
+        assert archive.add("Meeting moved to 3pm")
+        archive.delete(archive.get_all()[0]["id"])
+        assert archive.add("Meeting moved to 3pm")
+
+    def test_existing_entries_are_checked(self, tmp_path):
+        ArchivalMemory(storage_path=tmp_path).add("Meeting moved to 3pm")
+        reloaded = ArchivalMemory(storage_path=tmp_path)
+        assert not reloaded.add("Meeting moved to 3pm")
+
+
+def test_search_text_is_not_persisted(archive, tmp_path):
+    archive.add("Meeting moved to 3pm")
+    assert archive.search("3PM")
+    stored = json.loads((tmp_path / "archival.jsonl").read_text().splitlines()[0])
+    assert "content_lower" not in stored
+    assert "content_lower" not in archive.get_all()[0]
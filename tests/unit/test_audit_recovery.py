@@ -0,0 +1,63 @@
+"""Unit tests for the Audit & Recovery Engine."""
+
+import pytest
+
+from digital_humain.core.audit_recovery import AuditRecoveryEngine
+
+
+class TestAuditRecoveryEngine:
+    """Test AuditRecoveryEngine statistics."""
+    
+    def _log(self, are, step, confidence, error=None):
+        return are.log_reasoning(
+            step=step,
+            observation=f"observation {step}",
+            reasoning=f"reasoning {step}",
+            action={"type": "click", "step": step},
+            confidence=confidence,
+            error=error
+        )
+    
+    def test_average_confidence(self, tmp_path):
+        """Test average confidence over logged steps."""
+        are = AuditRecoveryEngine(storage_path=str(tmp_path))
+        
+        assert are.get_stats()["average_confidence"] == 0.0
+        
+        for i, conf in enumerate([0.5, 0.75, 1.0], 1):
+            self._log(are, i, conf)
+        
+        assert are.get_stats()["average_confidence"] == pytest.approx(0.75)
+    
+    def test_average_confidence_tracks_retained_logs(self, tmp_path):
+        """Test that stats only cover logs kept under max_logs."""
+        are = AuditRecoveryEngine(storage_path=str(tmp_path), max_logs=2)
+        
+        for i, conf in enumerate([0.1, 0.8, 0.6], 1):
+            self._log(are, i, conf)
+        
+        stats = are.get_stats()
+        assert stats["total_logs"] == 2
+        assert stats["average_confidence"] == pytest.approx(0.7)
+    
+    def test_error_count_and_checkpoint_logs(self, tmp_path):
+        """Test error count and checkpoint log selection after wrap-around."""
+        are = AuditRecoveryEngine(storage_path=str(tmp_path), max_logs=3)
+        
+        logs = [self._log(are, i, 0.9, error="boom" if i % 2 else None) for i in range(1, 6)]
+        
+        assert are.get_stats()["error_count"] == 2
+        
+        checkpoint = are.create_checkpoint(task="t", step=4, state_snapshot={})
+        assert checkpoint.reasoning_logs == [logs[2].id, logs[3].id]
+    
+    def test_clear_resets_stats(self, tmp_path):
+        """Test clearing logs resets statistics."""
+        are = AuditRecoveryEngine(storage_path=str(tmp_path))
+        self._log(are, 1, 0.9)
+        
+        are.clear(confirm=True)
+        
+        stats = are.get_stats()
+        assert stats["total_logs"] == 0
+        assert stats["average_confidence"] == 0.0
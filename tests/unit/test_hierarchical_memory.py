@@ -0,0 +1,33 @@
+"""Unit tests for the Hierarchical Memory Manager."""
+
+import pytest
+
+from digital_humain.memory.hierarchical_memory import HierarchicalMemoryManager
+
+
+class TestHierarchicalMemoryManager:
+    """Test main context and AKB size bookkeeping."""
+    
+    def test_replacing_key_does_not_double_count(self, tmp_path):
+        """Test that re-adding a key replaces its size instead of adding to it."""
+        hmm = HierarchicalMemoryManager(akb_storage_path=str(tmp_path))
+        hmm.add_to_context("task", {"value": "a"})
+        second = hmm.add_to_context("task", {"value": "abcdef"})
+        
+        assert hmm.get_stats()["main_context"]["size_bytes"] == second.size_bytes
+    
+    def test_akb_size_follows_page_out_and_delete(self, tmp_path):
+        """Test that AKB size stats track paged-out and deleted pages."""
+        hmm = HierarchicalMemoryManager(akb_storage_path=str(tmp_path))
+        a = hmm.add_to_context("a", {"value": "alpha"})
+        b = hmm.add_to_context("b", {"value": "beta"})
+        hmm.page_out(["a", "b"])
+        
+        assert hmm.main_context_size == 0
+        assert hmm.akb.get_stats()["total_size_bytes"] == a.size_bytes + b.size_bytes
+        
+        hmm.akb.delete(a.id)
+        assert hmm.akb.get_stats()["total_size_bytes"] == b.size_bytes
+        
+        reloaded = HierarchicalMemoryManager(akb_storage_path=str(tmp_path))
+        assert reloaded.akb.get_stats()["total_size_bytes"] == b.size_bytes
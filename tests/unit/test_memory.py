@@ -293,6 +293,24 @@ class TestEpisodicMemory:
             episodes = memory.get_all_episodes()
             assert all(f"Observation {i}" in ep.observation for i, ep in enumerate(episodes, start=5))
     
+    def test_add_episodes_bulk(self):
+        """Test bulk adding applies the guardrail and max limit once."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            memory = EpisodicMemory(storage_path=tmpdir, max_episodes=5)
+            
+            batch = [
+                {"observation": f"Observation {i}", "reasoning": f"Reasoning {i}", "action": {"step": i}}
+                for i in range(8)
+            ]
+            batch.append({"observation": "Typing password", "reasoning": "Login", "action": {}})
+            
+            added = memory.add_episodes_bulk(batch)
+            
+            assert len(added) == 8
+            episodes = memory.get_all_episodes()
+            assert [ep.observation for ep in episodes] == [f"Observation {i}" for i in range(3, 8)]
+            assert len(list(Path(tmpdir).glob("episode_*.json"))) == 8
+    
     def test_secret_filtering(self):
         """Test that episodes with secrets are not stored."""
         with tempfile.TemporaryDirectory() as tmpdir:
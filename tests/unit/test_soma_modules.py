@@ -4,14 +4,26 @@ import sys
 from unittest.mock import Mock, patch
 
 # Mock dependencies that may not be available
-sys.modules['loguru'] = Mock()
 logger_mock = Mock()
-sys.modules['loguru'].logger = logger_mock
+loguru_mock = Mock()
+loguru_mock.logger = logger_mock
 
-sys.modules['langgraph'] = Mock()
-sys.modules['langgraph.graph'] = Mock()
-sys.modules['langchain'] = Mock()
-sys.modules['pydantic'] = Mock()
+# Applied only while this module's tests run, so other test modules see the real packages
+_mocked_modules = patch.dict(sys.modules, {
+    'loguru': loguru_mock,
+    'langgraph': Mock(),
+    'langgraph.graph': Mock(),
+    'langchain': Mock(),
+    'pydantic': Mock(),
+})
+
+
+def setup_module():
+    _mocked_modules.start()
+
+
+def teardown_module():
+    _mocked_modules.stop()
 
 
 def test_audit_recovery_engine_import():
@@ -96,6 +108,7 @@ def test_learning_tools_import():
 
 
 if __name__ == "__main__":
+    setup_module()
     test_audit_recovery_engine_import()
     test_hierarchical_memory_manager_import()
     test_orchestration_engine_import()
@@ -0,0 +1,109 @@
+"""Unit tests for the Workflow Definition Language."""
+
+from digital_humain.learning.workflow_definition import (
+    ActionType,
+    EpisodicMemory,
+    NarrativeMemory,
+    WorkflowAction,
+    WorkflowDefinition,
+    WorkflowLibrary,
+    WorkflowStep,
+)
+
+
+def make_workflow(name: str, goal: str) -> WorkflowDefinition:
+    """Build a minimal one-step workflow."""
+    return WorkflowDefinition.create(
+        name=name,
+        narrative_memory=NarrativeMemory(goal=goal, user_intent=goal),
+        episodic_memory=EpisodicMemory(application="TestApp"),
+        steps=[
+            WorkflowStep(
+                step_number=1,
+                description="Click submit",
+                actions=[WorkflowAction(action_type=ActionType.CLICK, target="Submit button")]
+            )
+        ]
+    )
+
+
+class TestWorkflowDefinition:
+    """Test WorkflowDefinition helpers."""
+    
+    def test_summary_tracks_version_update(self):
+        """Test get_summary returns a fresh copy that follows update_version."""
+        workflow = make_workflow("Login to ShopApp", "Authenticate user")
+        summary = workflow.get_summary()
+        assert summary['total_actions'] == 1
+        
+        summary['name'] = "mutated"
+        summary['tags'].append("mutated")
+        assert workflow.get_summary()['name'] == "Login to ShopApp"
+        assert "mutated" not in workflow.tags
+        
+        workflow.update_version("Tweak")
+        assert workflow.get_summary()['version'] == "1.0.1"
+    
+    def test_summary_tracks_direct_field_changes(self):
+        """Test get_summary reflects fields changed without a helper method."""
+        workflow = make_workflow("Login to ShopApp", "Authenticate user")
+        workflow.get_summary()
+        
+        workflow.category = "auth"
+        workflow.tags.append("login")
+        workflow.narrative_memory.goal = "Sign in"
+        summary = workflow.get_summary()
+        assert summary['category'] == "auth"
+        assert "login" in summary['tags']
+        assert summary['goal'] == "Sign in"
+    
+    def test_summary_refreshed_after_step_changes(self):
+        """Test get_summary follows add_step and remove_step."""
+        workflow = make_workflow("Login to ShopApp", "Authenticate user")
+        assert workflow.get_summary()['total_steps'] == 1
+        
+        workflow.add_step(WorkflowStep(
+            step_number=2,
+            description="Type password",
+            actions=[
+                WorkflowAction(action_type=ActionType.CLICK, target="Password field"),
+                WorkflowAction(action_type=ActionType.TYPE, value="secret")
+            ]
+        ))
+        summary = workflow.get_summary()
+        assert summary['total_steps'] == 2
+        assert summary['total_actions'] == 3
+        assert summary['updated_at'] == workflow.updated_at
+        
+        assert workflow.remove_step(1)
+        summary = workflow.get_summary()
+        assert summary['total_steps'] == 1
+        assert summary['total_actions'] == 2
+
+
+class TestWorkflowLibrary:
+    """Test WorkflowLibrary search."""
+    
+    def test_search_by_name_and_goal(self, tmp_path):
+        """Test substring search over name and goal."""
+        library = WorkflowLibrary(storage_path=str(tmp_path))
+        library.add_workflow(make_workflow("Login to ShopApp", "Authenticate user"))
+        library.add_workflow(make_workflow("Export report", "Download monthly CSV"))
+        
+        assert [w['name'] for w in library.search_workflows("login")] == ["Login to ShopApp"]
+        assert [w['name'] for w in library.search_workflows("MONTHLY")] == ["Export report"]
+        assert library.search_workflows("nonexistent") == []
+        assert len(library.search_workflows("o")) == 2
+    
+    def test_search_after_delete_and_reload(self, tmp_path):
+        """Test the search index follows deletes and is rebuilt on load."""
+        library = WorkflowLibrary(storage_path=str(tmp_path))
+        login = make_workflow("Login to ShopApp", "Authenticate user")
+        library.add_workflow(login)
+        library.add_workflow(make_workflow("Export report", "Download monthly CSV"))
+        
+        reloaded = WorkflowLibrary(storage_path=str(tmp_path))
+        assert len(reloaded.search_workflows("report")) == 1
+        
+        assert reloaded.delete_workflow(login.id) is True
+        assert reloaded.search_workflows("login") == []